@@ -13,6 +13,7 @@ respect to managing focus.
 """
 
 
+import bisect
 import logging
 
 import wx
@@ -59,10 +60,10 @@ class AutoTextCtrl(wx.Panel):
         self.SetSizer(self.__sizer)
 
         # The takeFocus flag is set by SetTakeFocus,
-        # and used in __showPopup. The options array
+        # and used in __showPopup. The options index
         # contains the auto complete options.
         self.__takeFocus = False
-        self.__options   = []
+        self.__options   = _OptionIndex([], style & ATC_CASE_SENSITIVE)
 
         self.__textCtrl.Bind(wx.EVT_TEXT,        self.__onText)
         self.__textCtrl.Bind(wx.EVT_LEFT_DCLICK, self.__onDoubleClick)
@@ -111,7 +112,8 @@ class AutoTextCtrl(wx.Panel):
 
     def AutoComplete(self, options):
         """Set the list of options to be shown to the user. """
-        self.__options = list(options)
+        self.__options = _OptionIndex(options,
+                                      self.__style & ATC_CASE_SENSITIVE)
 
 
     def GetValue(self):
@@ -309,7 +311,8 @@ class AutoCompletePopup(wx.Dialog):
         :arg parent:  The ``wx`` parent object.
         :arg atc:     The :class:`AutoTextCtrl` that is using this popup.
         :arg text:    Initial text value.
-        :arg options: A list of all possible auto-completion options.
+        :arg options: A list of all possible auto-completion options, or an
+                      :class:`_OptionIndex` containing them.
         :arg style:   Style flags.
         """
 
@@ -321,6 +324,10 @@ class AutoCompletePopup(wx.Dialog):
         self.__caseSensitive  =      style & ATC_CASE_SENSITIVE
         self.__propagateEnter = not (style & ATC_NO_PROPAGATE_ENTER)
         self.__atc            = atc
+
+        if not isinstance(options, _OptionIndex):
+            options = _OptionIndex(options, self.__caseSensitive)
+
         self.__options        = options
         self.__textCtrl       = wx.TextCtrl(self,
                                             value=text,
@@ -495,16 +502,7 @@ class AutoCompletePopup(wx.Dialog):
         prefix.
         """
 
-        prefix  = prefix.strip()
-        options = self.__options
-
-        if not self.__caseSensitive:
-            prefix  = prefix.lower()
-            options = [o.lower() for o in options]
-
-        matches = [o.startswith(prefix) for o in options]
-
-        return [o for o, m in zip(self.__options, matches) if m]
+        return self.__options.matches(prefix.strip())
 
 
     def __onKeyDown(self, ev):
@@ -651,3 +649,60 @@ ATCPopupDestroyEvent = _ATCPopupDestroyEvent
 """Event emitted when the :class:`AutoCompletePopup` is destroyed. This
 event is emitted because the ``wx.EVT_WINDOW_DESTROY`` is too unreliable.
 """
+
+
+class _OptionIndex:
+    """Used by the :class:`AutoTextCtrl` and :class:`AutoCompletePopup` to
+    find auto-completion options which start with a given prefix.
+
+    The options are sorted once, when the ``_OptionIndex`` is created, so
+    that the options matching a prefix can be found with a binary search,
+    rather than by testing every option on every key press.
+    """
+
+    def __init__(self, options, caseSensitive):
+        """Create an ``_OptionIndex``.
+
+        :arg options:       Sequence of auto-completion options.
+        :arg caseSensitive: If ``False``, matching is case insensitive.
+        """
+
+        options = list(options)
+
+        if caseSensitive: keys = options
+        else:             keys = [o.lower() for o in options]
+
+        # The sorted keys, and the index of
+        # the option corresponding to each key
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+
+        self.__caseSensitive = caseSensitive
+        self.__options       = options
+        self.__order         = order
+        self.__keys          = [keys[i] for i in order]
+
+
+    def __len__(self):
+        """Returns the number of options in this ``_OptionIndex``. """
+        return len(self.__options)
+
+
+    def matches(self, prefix):
+        """Returns a list of all options which start with the given prefix,
+        in the order in which they were originally provided.
+        """
+
+        if not self.__caseSensitive:
+            prefix = prefix.lower()
+
+        keys = self.__keys
+        lo   = bisect.bisect_left(keys, prefix)
+        hi   = lo
+
+        # All keys starting with the prefix
+        # are adjacent in the sorted list
+        while hi < len(keys) and keys[hi].startswith(prefix):
+            hi += 1
+
+        options = self.__options
+        return [options[i] for i in sorted(self.__order[lo:hi])]
@@ -267,3 +267,20 @@ def _test_popup_focusback():
     simtext(sim, atc.popup.textCtrl, 'abc')
 
     assert atc.GetValue() == 'abc'
+
+
+def test_option_index():
+    opts = ['bcc', 'aba', 'AAB', 'aaa', 'ab', 'b', 'aba']
+
+    idx = autott._OptionIndex(opts, False)
+    assert len(idx)          == 7
+    assert idx.matches('')   == opts
+    assert idx.matches('a')  == ['aba', 'AAB', 'aaa', 'ab', 'aba']
+    assert idx.matches('aa') == ['AAB', 'aaa']
+    assert idx.matches('AB') == ['aba', 'ab', 'aba']
+    assert idx.matches('z')  == []
+
+    idx = autott._OptionIndex(opts, True)
+    assert idx.matches('')  == opts
+    assert idx.matches('a') == ['aba', 'aaa', 'ab', 'aba']
+    assert idx.matches('A') == ['AAB']
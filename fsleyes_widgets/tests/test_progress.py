@@ -9,6 +9,7 @@ import time
 import wx
 
 import numpy as np
+import pytest
 
 from unittest import mock
 
@@ -196,3 +197,17 @@ def _test_runWithBounce_cancel():
     dlg.Destroy()
 
     assert not finished[0] and not completed[0]
+
+
+def test_runWithBounce_invalid_polltime():
+    def func():
+        pass
+    with pytest.raises(ValueError):
+        progress.runWithBounce(func, pollTime=0)
+    with pytest.raises(ValueError):
+        progress.runWithBounce(func, pollTime=-1)
+
+
+def test_Bounce_empty_values():
+    with pytest.raises(ValueError):
+        progress.Bounce(values=[])
@@ -42,3 +42,22 @@ def test_textbitmap():
 
         benchmark = mplimg.imread(fname) * 255
         assert compare_images(bmp, benchmark, 0.1)[0]
+
+
+def test_textbitmap_glyph_cache():
+
+    bmp1 = textbmp.textBitmap('R', fontSize=10, fgColour=(1, 0, 0, 1))
+    bmp2 = textbmp.textBitmap('R', fontSize=10, fgColour=(1, 0, 0, 1))
+
+    assert bmp1 is not bmp2
+    assert (bmp1 == bmp2).all()
+
+    # returned bitmaps must be independent
+    # of the cached bitmap
+    bmp1[:] = 0
+    bmp3 = textbmp.textBitmap('R', fontSize=10, fgColour=(1, 0, 0, 1))
+    assert (bmp3 == bmp2).all()
+
+    # unhashable colours should still work
+    bmp4 = textbmp.textBitmap('R', fontSize=10, fgColour=[1, 0, 0, 1])
+    assert (bmp4 == bmp2).all()
@@ -29,6 +29,16 @@ def test_fileToUrl():
         expect = f'file://{expect}'
         assert webpage.fileToUrl(fname) == expect
 
+    # paths with characters that need quoting
+    testcases = [
+        ('/tmp/a\n',      'file:///tmp/a%0A'),
+        ('/tmp/a\tb',     'file:///tmp/a%09b'),
+        ('/tmp/a b.html', 'file:///tmp/a%20b.html'),
+    ]
+
+    for fname, expect in testcases:
+        assert webpage.fileToUrl(fname) == expect
+
 
 def test_openPage():
 
@@ -75,6 +75,160 @@ def _test_reorder():
         cells  = [cells[ i] for i in neworder]
 
 
+def test_refresh_incremental():
+    run_with_wx(_test_refresh_incremental)
+def _test_refresh_incremental():
+    frame = wx.GetApp().GetTopWindow()
+    grid  = widgetgrid.WidgetGrid(frame,
+                                  style=widgetgrid.WG_SELECTABLE_CELLS)
+    red   = wx.Colour('#ff0000')
+    green = wx.Colour('#00ff00')
+    blue  = wx.Colour('#0000ff')
+
+    grid.SetColours(selected=red, odd=green, even=blue)
+    grid.SetGridSize(3, 3)
+
+    for i in range(3):
+        for j in range(3):
+            grid.SetText(i, j, 'cell [{}, {}]'.format(i, j))
+
+    grid.Refresh()
+    grid.SetSelection(1, 1)
+
+    # replace a cell after the grid has been built
+    grid.SetWidget(0, 0, wx.StaticText(frame, label='new cell'))
+    grid.Refresh()
+    realYield()
+
+    assert grid.GetWidget(0, 0).GetLabel()           == 'new cell'
+    assert grid.GetWidget(0, 0).GetBackgroundColour() == blue
+    assert grid.GetWidget(2, 2).GetBackgroundColour() == blue
+    assert grid.GetWidget(1, 0).GetBackgroundColour() == green
+
+    # selection should be preserved across refreshes
+    assert grid.GetWidget(1, 1).GetBackgroundColour() == red
+
+
+def test_insert_delete_row_indices():
+    run_with_wx(_test_insert_delete_row_indices)
+def _test_insert_delete_row_indices():
+    frame = wx.GetApp().GetTopWindow()
+    grid  = widgetgrid.WidgetGrid(frame)
+    grid.SetGridSize(4, 2)
+
+    for i in range(4):
+        for j in range(2):
+            grid.SetText(i, j, 'cell [{}, {}]'.format(i, j))
+    grid.Refresh()
+
+    w = grid.GetWidget(2, 1)
+    assert grid.GetRow(w)    == 2
+    assert grid.GetColumn(w) == 1
+
+    grid.InsertRow(0)
+    grid.Refresh()
+    assert grid.GetRow(w)    == 3
+    assert grid.GetColumn(w) == 1
+
+    grid.DeleteRow(1)
+    grid.DeleteRow(0)
+    assert grid.GetRow(w)    == 1
+    assert grid.GetColumn(w) == 1
+
+    assert grid.GetRow(   frame) == -1
+    assert grid.GetColumn(frame) == -1
+
+
+def test_insert_delete_row_colours():
+    run_with_wx(_test_insert_delete_row_colours)
+def _test_insert_delete_row_colours():
+    frame = wx.GetApp().GetTopWindow()
+    grid  = widgetgrid.WidgetGrid(frame)
+    green = wx.Colour('#00ff00')
+    blue  = wx.Colour('#0000ff')
+
+    grid.SetColours(odd=green, even=blue)
+    grid.SetGridSize(4, 2)
+
+    for i in range(4):
+        for j in range(2):
+            grid.SetText(i, j, 'cell [{}, {}]'.format(i, j))
+    grid.Refresh()
+
+    def check():
+        nrows, ncols = grid.GetGridSize()
+        for i in range(nrows):
+            for j in range(ncols):
+                exp = green if i % 2 else blue
+                assert grid.GetWidget(i, j).GetBackgroundColour() == exp
+
+    grid.InsertRow(1)
+    grid.Refresh()
+    check()
+
+    grid.InsertRow(5)
+    grid.Refresh()
+    check()
+
+    grid.DeleteRow(0)
+    grid.DeleteRow(4)
+    grid.Refresh()
+    check()
+
+
+def test_setwidgets():
+    run_with_wx(_test_setwidgets)
+def _test_setwidgets():
+    frame   = wx.GetApp().GetTopWindow()
+    grid    = widgetgrid.WidgetGrid(frame)
+    grid.SetGridSize(3, 3)
+    widgets = [(i, j, wx.StaticText(frame, label=f'{i}, {j}'))
+               for i in range(3) for j in range(3)]
+    grid.SetWidgets(widgets)
+    grid.Refresh()
+
+    for i, j, w in widgets:
+        assert grid.GetWidget(i, j) is w
+        assert grid.GetRow(w)       == i
+        assert grid.GetColumn(w)    == j
+
+
+def test_widgets_property():
+    run_with_wx(_test_widgets_property)
+def _test_widgets_property():
+    frame = wx.GetApp().GetTopWindow()
+    grid  = widgetgrid.WidgetGrid(frame)
+    grid.SetGridSize(2, 3)
+    text  = wx.StaticText(frame, label='text')
+    grid.SetWidget(1, 2, text)
+
+    # Cells which have not been created
+    # are None - reading the property
+    # must not create placeholders
+    widgets = grid.widgets
+    assert len(widgets) == 2
+    assert all(len(row) == 3 for row in widgets)
+    assert widgets[1][2] is text.GetParent()
+    assert all(w is None for row in widgets for w in row
+               if w is not widgets[1][2])
+    assert grid.widgets == widgets
+
+
+def test_refresh_async():
+    run_with_wx(_test_refresh_async)
+def _test_refresh_async():
+    frame = wx.GetApp().GetTopWindow()
+    grid  = widgetgrid.WidgetGrid(frame)
+    grid.SetGridSize(2, 2)
+
+    with mock.patch.object(grid, '_WidgetGrid__refresh') as refresh:
+        for i in range(5):
+            grid.Refresh(sync=False)
+        assert refresh.call_count == 0
+        realYield()
+        assert refresh.call_count == 1
+
+
 class FakeMouseState(object):
     def __init__(self):
         self.pos = wx.Point(0, 0)
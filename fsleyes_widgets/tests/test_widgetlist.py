@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+#
+# test_widgetlist.py -
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+
+
+import pytest
+import wx
+
+import fsleyes_widgets.widgetlist as widgetlist
+
+from . import run_with_wx, realYield
+
+
+def test_usage():
+    run_with_wx(_test_usage)
+def _test_usage():
+    frame  = wx.GetApp().GetTopWindow()
+    wlist  = widgetlist.WidgetList(frame)
+    widgs  = [wx.TextCtrl(frame) for i in range(3)]
+    gwidgs = [wx.TextCtrl(frame) for i in range(3)]
+
+    wlist.AddGroup('group', 'Group')
+
+    for i, w in enumerate(widgs):
+        wlist.AddWidget(w, f'Widget {i}')
+    for i, w in enumerate(gwidgs):
+        wlist.AddWidget(w, f'Group widget {i}', groupName='group')
+
+    realYield()
+
+    assert wlist.GetGroups()            == ['group']
+    assert wlist.GetWidgets()           == widgs
+    assert wlist.GetWidgets('group')    == gwidgs
+    assert wlist.GroupSize('group')     == 3
+
+    wlist.RemoveWidget(widgs[1])
+    assert wlist.GetWidgets() == [widgs[0], widgs[2]]
+
+    wlist.ClearGroup('group')
+    assert wlist.GroupSize('group') == 0
+
+    wlist.Clear()
+    assert wlist.GetWidgets() == []
+    assert wlist.GetGroups()  == []
+
+
+def test_batch():
+    run_with_wx(_test_batch)
+def _test_batch():
+    frame  = wx.GetApp().GetTopWindow()
+    wlist  = widgetlist.WidgetList(frame)
+    events = []
+    widgs  = [wx.TextCtrl(frame) for i in range(5)]
+
+    wlist.Bind(widgetlist.EVT_WL_CHANGE_EVENT, events.append)
+    wlist.AddGroup('group')
+    realYield()
+    events.clear()
+
+    wlist.BeginBatch()
+    wlist.BeginBatch()
+    for i, w in enumerate(widgs[:3]):
+        wlist.AddWidget(w, f'Widget {i}')
+    wlist.EndBatch()
+    for w, label in zip(widgs[3:], ['x', 'A much longer widget label']):
+        wlist.AddWidget(w, label, groupName='group')
+    wlist.EndBatch()
+
+    realYield()
+
+    assert len(events) == 1
+    assert wlist.GetWidgets()        == widgs[:3]
+    assert wlist.GetWidgets('group') == widgs[3:]
+
+    # labels within a group should all
+    # be sized to fit the widest label
+    labels    = [w.GetParent().GetChildren()[-1] for w in widgs[3:]]
+    widths    = [lbl.GetMinSize()[0]  for lbl in labels]
+    bestWidth = max(lbl.GetBestSize()[0] for lbl in labels)
+    assert len(set(widths)) == 1
+    assert widths[0]        >= bestWidth
+
+    with pytest.raises(ValueError):
+        wlist.EndBatch()
+
+
+def test_change_events_coalesced():
+    run_with_wx(_test_change_events_coalesced)
+def _test_change_events_coalesced():
+    frame  = wx.GetApp().GetTopWindow()
+    wlist  = widgetlist.WidgetList(frame)
+    events = []
+    widgs  = [wx.TextCtrl(frame) for i in range(5)]
+
+    wlist.Bind(widgetlist.EVT_WL_CHANGE_EVENT, events.append)
+
+    for i, w in enumerate(widgs):
+        wlist.AddWidget(w, f'Widget {i}')
+    wlist.RemoveWidget(widgs[0])
+
+    assert len(events) == 0
+    realYield()
+    assert len(events) == 1
+
+    wlist.RemoveWidget(widgs[1])
+    realYield()
+    assert len(events) == 2
@@ -9,7 +9,10 @@
 """
 
 
+import time
+import weakref
 import warnings
+import itertools
 import threading
 import contextlib
 
@@ -49,7 +52,8 @@ def runWithBounce(task, *args, **kwargs):
 
     :arg polltime: Must be passed as a keyword argument. Amount of time in
                    seconds to wait while periodically checking the task
-                   state. Defaults to 0.1 seconds.
+                   state. Defaults to 0.1 seconds. Values smaller than
+                   0.01 seconds are clamped to 0.01 seconds.
 
     All other arguments are passed through to :meth:`Bounce.__init__`,
     unless a ``dlg`` is provided.
@@ -64,11 +68,31 @@ def runWithBounce(task, *args, **kwargs):
     callback = kwargs.pop('callback', None)
     owndlg   = dlg is None
 
+    # A wx.Timer with an interval of zero
+    # will spin continuously, and very small
+    # intervals are below the resolution of
+    # most OS timers.
+    if polltime <= 0:
+        raise ValueError(f'Invalid poll time: {polltime}')
+    polltime = max(polltime, 0.01)
+
     if dlg is None:
         dlg = Bounce(*args, **kwargs)
 
+    # The task thread sets this event when it
+    # has finished - the main thread never
+    # blocks on it, it is just polled by a
+    # wx timer.
+    done = threading.Event()
+
+    def runTask():
+        try:
+            task()
+        finally:
+            done.set()
+
     timer         = wx.Timer(dlg)
-    thread        = threading.Thread(target=task)
+    thread        = threading.Thread(target=runTask)
     thread.daemon = True
 
     def realCallback(completed):
@@ -80,7 +104,7 @@ def runWithBounce(task, *args, **kwargs):
             callback(completed)
 
     def poll(ev):
-        if not thread.is_alive():
+        if done.is_set():
             realCallback(True)
         elif dlg.WasCancelled():
             realCallback(False)
@@ -129,11 +153,20 @@ class Bounce(wx.ProgressDialog):
         if title   is None: title   = 'Title'
         if message is None: message = 'Message'
 
-        self.__delay     = kwargs.pop('delay',  200)
-        self.__values    = kwargs.pop('values', [1, 25, 50, 75, 99])
-        self.__direction = 1
-        self.__index     = 0
-        self.__bouncing  = False
+        values = list(kwargs.pop('values', [1, 25, 50, 75, 99]))
+
+        if len(values) == 0:
+            raise ValueError('The values argument must contain at least '
+                             'one value')
+
+        # The progress bar cycles forwards
+        # through the values, and then back
+        # again. __value is the most recently
+        # displayed value.
+        self.__delay    = kwargs.pop('delay',  200)
+        self.__cycle    = itertools.cycle(values + values[-2:0:-1])
+        self.__value    = values[0]
+        self.__bouncing = False
 
         wx.ProgressDialog.__init__(self, title, message, *args, **kwargs)
 
@@ -152,31 +185,34 @@ class Bounce(wx.ProgressDialog):
 
     def Close(self):
         """Close the ``Bounce`` dialog. """
-        self.__bouncing = False
+        self.StopBounce()
         wx.ProgressDialog.Close(self)
 
 
     def EndModal(self, code=wx.ID_OK):
         """Close the ``Bounce`` dialog. """
-        self.__bouncing = False
+        self.StopBounce()
         wx.ProgressDialog.EndModal(self, code)
 
 
     def Destroy(self):
         """Destroy the ``Bounce`` dialog. """
-        self.__bouncing = False
+        self.StopBounce()
         wx.ProgressDialog.Destroy(self)
 
 
     def StartBounce(self):
         """Start automatic bouncing. """
-        self.__bouncing = True
-        self.__autoBounce()
+        if not self.__bouncing and self.DoBounce():
+            self.__bouncing = True
+            _BounceTimer.add(self, self.__delay)
 
 
     def StopBounce(self):
         """Stop automatic bouncing. """
-        self.__bouncing = False
+        if self.__bouncing:
+            self.__bouncing = False
+            _BounceTimer.remove(self)
 
 
     def Update(self, value, message=None):
@@ -187,13 +223,15 @@ class Bounce(wx.ProgressDialog):
         ``message`` of ``None``.
         """
 
-        if message is None: return super(Bounce, self).Update(value)
-        else:               return super(Bounce, self).Update(value, message)
+        if message is None: args = (value,)
+        else:               args = (value, message)
+
+        return wx.ProgressDialog.Update(self, *args)
 
 
     def UpdateMessage(self, message):
         """Updates the message displayed on the dialog. """
-        self.Update(self.__values[self.__index], message)
+        self.Update(self.__value, message)
 
 
     def DoBounce(self, message=None):
@@ -205,47 +243,140 @@ class Bounce(wx.ProgressDialog):
                       otherwise.
         """
 
-        newval = self.__values[self.__index]
-
-        if self.WasCancelled() or \
-           not self.Update(newval, message):
+        if self.WasCancelled():
             return False
 
-        self.__index += self.__direction
+        self.__value = next(self.__cycle)
 
-        if self.__index >= len(self.__values):
-            self.__index     = len(self.__values) - 2
-            self.__direction = -self.__direction
-        elif self.__index == 0:
-            self.__index     = 0
-            self.__direction = -self.__direction
+        if not self.Update(self.__value, message):
+            return False
 
         return True
 
 
-    def __autoBounce(self):
-        """Automatic bouncing.
+class _BounceTimer(wx.Timer):
+    """A ``wx.Timer`` which is shared by all :class:`Bounce` dialogs that are
+    bouncing automatically (via :meth:`Bounce.StartBounce`), so that only one
+    timer is running, regardless of how many dialogs are open.
+
+    A ``_BounceTimer`` is created when the first dialog is registered via
+    :meth:`add`, and stopped and discarded when the last dialog is
+    de-registered via :meth:`remove`. The timer runs at the shortest
+    ``delay`` of all registered dialogs, and each dialog is bounced after
+    its own ``delay`` has elapsed.
+    """
+
+
+    instance = None
+    """The currently running ``_BounceTimer``, or ``None`` if no dialogs are
+    bouncing.
+    """
+
+
+    @classmethod
+    def add(cls, bouncer, delay):
+        """Register a :class:`Bounce` dialog which is to be bounced every
+        ``delay`` milliseconds.
+        """
+        if cls.instance is None:
+            cls.instance = _BounceTimer()
+        cls.instance.__add(bouncer, delay)
+
+
+    @classmethod
+    def remove(cls, bouncer):
+        """De-register a :class:`Bounce` dialog. """
+        if cls.instance is not None:
+            cls.instance.__remove(bouncer)
+
+
+    def __init__(self):
+        """Create a ``_BounceTimer``. Don't call this directly - use the
+        :meth:`add` and :meth:`remove` methods.
+        """
+        wx.Timer.__init__(self)
+
+        # {id(bouncer) : [weakref(bouncer), delay, time of last bounce]}
+        #
+        # We store weak references, keyed by id,
+        # so that we don't keep destroyed dialogs
+        # alive, and don't require them to be
+        # hashable.
+        self.__bouncers  = {}
+        self.__notifying = False
+
+
+    def __add(self, bouncer, delay):
+        """Register a dialog, and (re-)start the timer if needed. """
+        self.__bouncers[id(bouncer)] = [weakref.ref(bouncer),
+                                        delay,
+                                        time.monotonic()]
+        self.__restart()
+
+
+    def __remove(self, bouncer):
+        """De-register a dialog, and stop/restart the timer if needed. """
+        self.__bouncers.pop(id(bouncer), None)
+        self.__restart()
 
-        If a call to :meth:`StopBounce` has been made, this method does
-        nothing.
 
-        Otherwise, calls :meth:`DoBounce` and, if that call returns ``True``,
-        schedules a future call to this method.
+    def __restart(self):
+        """Called when dialogs are registered/de-registered. Stops the timer
+        if there are no dialogs, or otherwise makes sure that it is running
+        at the shortest registered delay.
         """
 
-        # We use a closure, as if this dialog
-        # gets destroyed while a call is
-        # scheduled, wx segfaults when it tries
-        # to call the instance method.
-        def realAutoBounce():
+        if len(self.__bouncers) == 0:
+            self.Stop()
+            if _BounceTimer.instance is self:
+                _BounceTimer.instance = None
+            return
+
+        interval = int(min(b[1] for b in self.__bouncers.values()))
+
+        if not self.IsRunning() or self.GetInterval() != interval:
+            self.Start(interval, wx.TIMER_CONTINUOUS)
+
+
+    def Notify(self):
+        """Called on every timer tick. Bounces every dialog whose delay has
+        elapsed, and de-registers dialogs which have been destroyed or
+        cancelled.
+        """
+
+        # Bounce.DoBounce may cause events to
+        # be processed, and hence cause this
+        # method to be called re-entrantly.
+        if self.__notifying:
+            return
+
+        self.__notifying = True
+
+        try:
+            now      = time.monotonic()
+            interval = self.GetInterval()
+
+            for key, entry in list(self.__bouncers.items()):
+
+                ref, delay, last = entry
+                bouncer          = ref()
+
+                if bouncer is None or not isalive(bouncer):
+                    self.__bouncers.pop(key, None)
+                    continue
 
-            if not isalive(self):
-                return
+                # Allow some slack so that a dialog
+                # is not skipped when the timer
+                # fires slightly early.
+                if (now - last) * 1000 < delay - interval / 2:
+                    continue
 
-            if not self.__bouncing:
-                return
+                entry[2] = now
+                if not bouncer.DoBounce():
+                    bouncer.StopBounce()
 
-            if self.DoBounce():
-                wx.CallLater(self.__delay, realAutoBounce)
+        finally:
+            self.__notifying = False
 
-        realAutoBounce()
+        if len(self.__bouncers) == 0:
+            self.__restart()
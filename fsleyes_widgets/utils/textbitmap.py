@@ -10,6 +10,10 @@ some text off-screen using :mod:`matplotlib`, and returns it as an RGBA bitmap.
 """
 
 
+import functools
+import threading
+
+
 POINT_SIZE = 1 / 72
 """Size of one point in inches at 72 dpi. Font sizes are specified in points at
 72 dpi - this value is used to convert from font size to inches (and on to
@@ -17,6 +21,47 @@ pixels).
 """
 
 
+_figures = threading.local()
+"""Thread-local storage used by the :func:`_getFigure` function to cache
+``matplotlib`` figures, so they can be re-used across calls to
+:func:`textBitmap`.
+"""
+
+
+def _getFigure(dpi):
+    """Returns a ``(figure, canvas, axes, renderer)`` tuple which may be used
+    to render text at the given ``dpi``. Figures are created on first use, and
+    are cached per-thread and per-``dpi``.
+
+    The ``renderer`` is a tiny off-screen renderer which can be used to
+    measure text extents without allocating a full-size bitmap.
+    """
+
+    figures = getattr(_figures, 'figures', None)
+
+    if figures is None:
+        figures          = {}
+        _figures.figures = figures
+
+    if dpi not in figures:
+
+        import matplotlib.backends.backend_agg as mplagg
+        import matplotlib.figure               as mplfig
+
+        fig    = mplfig.Figure(dpi=dpi)
+        canvas = mplagg.FigureCanvasAgg(fig)
+        ax     = fig.add_axes([0, 0, 1, 1])
+        ax.axis('off')
+        ax.set_xticks([])
+        ax.set_yticks([])
+
+        renderer = mplagg.RendererAgg(1, 1, dpi)
+
+        figures[dpi] = (fig, canvas, ax, renderer)
+
+    return figures[dpi]
+
+
 def textBitmap(text,
                width=None,
                height=None,
@@ -75,33 +120,84 @@ def textBitmap(text,
     if halign in (None, 'centre'):
         halign = 'center'
 
+    import matplotlib.colors as mplcolors
+
+    # Convert colours to RGBA tuples up front,
+    # folding the alpha into the foreground
+    # colour, so matplotlib does not need to
+    # re-parse them.
+    if fgColour is None:     fgColour = '#000000'
+    if bgColour is not None: bgColour = mplcolors.to_rgba(bgColour)
+    fgColour = mplcolors.to_rgba(fgColour, alpha)
+
+    args = (text, width, height, fontSize, fgColour,
+            bgColour, fontFamily, halign, dpi)
+
+    # Single character labels (e.g. "R", "L")
+    # are very common, so we cache them. The
+    # arguments must be hashable for this to
+    # work.
+    if len(text) == 1 and text.isascii() and text.isprintable():
+        try:
+            hash(args)
+        except TypeError:
+            pass
+        else:
+            return _glyphBitmap(*args).copy()
+
+    return _textBitmap(*args)
+
+
+@functools.lru_cache(maxsize=1024)
+def _glyphBitmap(*args):
+    """Used by :func:`textBitmap`. Renders and caches bitmaps for single
+    characters. The returned array must not be modified.
+    """
+    return _textBitmap(*args)
+
+
+def _textBitmap(text,
+                width,
+                height,
+                fontSize,
+                fgColour,
+                bgColour,
+                fontFamily,
+                halign,
+                dpi):
+    """Used by :func:`textBitmap`. Renders the given text, and returns it as
+    a ``numpy.uint8`` array. The arguments are assumed to have already been
+    validated, and colours converted to RGBA tuples.
+    """
+
     # Imports are expensive
-    import numpy                           as np
-    import matplotlib.backends.backend_agg as mplagg
-    import matplotlib.transforms           as mplxf
-    import matplotlib.figure               as mplfig
+    import numpy                 as np
+    import matplotlib            as mpl
+    import matplotlib.transforms as mplxf
 
     # convert points to pixels or vice versa.
     # Estimate width from font size if not
     # provided - we will crop the result
     # afterwards.
     crop   = width is None
-    nlines = text.count('\n') + 1
+    nlines = text.count('\n') + 1 if '\n' in text else 1
     if fontSize is None: fontSize =          height   / POINT_SIZE / dpi
     if height   is None: height   = nlines * fontSize * POINT_SIZE * dpi
     if width    is None: width    = max(fontSize, fontSize * len(text))
-    if fgColour is None: fgColour = '#000000'
-
-    fig    = mplfig.Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
-    canvas = mplagg.FigureCanvasAgg(fig)
-    ax     = fig.add_axes([0, 0, 1, 1])
-    ax.axis('off')
 
-    if bgColour is not None: fig.patch.set_facecolor(bgColour)
-    else:                    fig.patch.set_alpha(0)
+    # Re-use a cached figure, clearing
+    # out text from any previous call
+    fig, canvas, ax, renderer = _getFigure(dpi)
+    fig.set_size_inches((width / dpi, height / dpi))
+    for t in list(ax.texts):
+        t.remove()
 
-    ax.set_xticks([])
-    ax.set_yticks([])
+    if bgColour is not None:
+        fig.patch.set_alpha(None)
+        fig.patch.set_facecolor(bgColour)
+    else:
+        fig.patch.set_facecolor(mpl.rcParams['figure.facecolor'])
+        fig.patch.set_alpha(0)
 
     if   halign == 'left':  tx = 0.0
     elif halign == 'right': tx = 1.0
@@ -115,14 +211,17 @@ def textBitmap(text,
                       horizontalalignment=halign,
                       transform=ax.transAxes,
                       color=fgColour,
-                      alpha=alpha,
                       fontfamily=fontFamily)
 
     # if a width wasn't specified, we auto-
     # fit the bitmap to the rendered text
     if crop:
-        # tight bounding box around text
-        bbox = textobj.get_window_extent(renderer=canvas.get_renderer())
+        # tight bounding box around text - text
+        # extents only depend on the dpi, so we
+        # measure with the small cached renderer,
+        # and only rasterise once, via the
+        # canvas.draw() call below.
+        bbox = textobj.get_window_extent(renderer=renderer)
 
         # a tiny amount seems to get cropped on the right, for
         # centre/right aligned text. So we shift the text left
@@ -137,14 +236,13 @@ def textBitmap(text,
 
     canvas.draw()
 
-    # get the bitmap data and reshape
-    # and transpose it to (H, W, [RGBA])
+    # get the bitmap data and reshape it to
+    # (H, W, [RGBA]). The Agg renderer stores
+    # its data in RGBA order, so we can read
+    # it directly. We take a copy, as the
+    # buffer is owned by the renderer.
     ncols, nrows = canvas.get_width_height()
-    bitmap       = canvas.tostring_argb()
-    bitmap       = np.frombuffer(bitmap, dtype=np.uint8)
-    bitmap       = bitmap.reshape(nrows, ncols, 4)
-    rgb          = bitmap[:, :, 1:]
-    a            = bitmap[:, :, 0]
-    bitmap       = np.dstack((rgb, a))
+    bitmap       = np.frombuffer(canvas.buffer_rgba(), dtype=np.uint8)
+    bitmap       = bitmap.reshape(nrows, ncols, 4).copy()
 
     return bitmap
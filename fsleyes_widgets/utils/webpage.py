@@ -18,16 +18,33 @@ The following functions are provided:
 """
 
 import os.path        as op
+import                   re
 import                   webbrowser
-import urllib.parse   as urlparse
 import urllib.request as urlrequest
 
 
+SAFE_PATH = re.compile(r'/[A-Za-z0-9/._\-]*')
+"""Regular expression matching absolute POSIX file paths which do not need
+any characters to be quoted when converted into a URL.
+"""
+
+
 def fileToUrl(fileName):
     """Converts a file path to a URL. """
     fileName = op.abspath(fileName)
-    fileName = urlrequest.pathname2url(fileName)
-    return urlparse.urljoin('file:', fileName)
+
+    # pathname2url is a no-op for simple POSIX
+    # paths, so we only call it when needed
+    if op.sep != '/' or SAFE_PATH.fullmatch(fileName) is None:
+        fileName = urlrequest.pathname2url(fileName)
+
+    # Depending on the platform and python
+    # version, pathname2url may or may not
+    # include an (empty) authority section
+    if not fileName.startswith('//'):
+        fileName = '//' + fileName
+
+    return 'file:' + fileName
 
 
 def openPage(url):
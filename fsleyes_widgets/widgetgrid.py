@@ -10,17 +10,36 @@ tabular grid of arbitrary widgets.
 
 
 import functools as ft
+import itertools as it
 import              logging
+import              weakref
 
 import wx
 import wx.lib.newevent as wxevent
 
+import fsleyes_widgets.utils         as wutils
 import fsleyes_widgets.utils.b64icon as b64icon
 
 
 log = logging.getLogger(__name__)
 
 
+def _frozen(func):
+    """Decorator for :class:`WidgetGrid` methods which add, remove, or
+    re-arrange lots of widgets. The grid is frozen while the method runs, so
+    that it is only re-painted once, rather than after every change to every
+    cell. Freezing the grid also freezes all of its children.
+    """
+    @ft.wraps(func)
+    def decorator(self, *args, **kwargs):
+        self.Freeze()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self.Thaw()
+    return decorator
+
+
 class WidgetGrid(wx.ScrolledWindow):
     """A scrollable panel which displays a tabular grid of widgets.  A
     ``WidgetGrid`` looks something like this:
@@ -42,6 +61,7 @@ class WidgetGrid(wx.ScrolledWindow):
         InsertRow
         SetColours
         SetWidget
+        SetWidgets
         SetText
         ClearGrid
 
@@ -139,6 +159,13 @@ class WidgetGrid(wx.ScrolledWindow):
     """
 
 
+    _dragIcon = None
+    """``wx.Bitmap`` used to show the drop location of a dragged column.
+    Initialised in :meth:`__init__`, and shared by all ``WidgetGrid``
+    instances, so that the icon only needs to be decoded once.
+    """
+
+
     def __init__(self, parent, style=None):
         """Create a ``WidgetGrid``.
 
@@ -181,6 +208,8 @@ class WidgetGrid(wx.ScrolledWindow):
         self.__dragLimit      = -1
         self.__dragStartCol   = None
         self.__dragCurrentCol = None
+        self.__dragMarkerPos  = None
+        self.__dragLastPos    = None
 
         if   style & WG_SELECTABLE_CELLS:   self.__selectable = 'cells'
         elif style & WG_SELECTABLE_ROWS:    self.__selectable = 'rows'
@@ -208,7 +237,10 @@ class WidgetGrid(wx.ScrolledWindow):
         # column will be placed when it is dropped.
         if self.__draggable:
 
-            self.__dragIcon  = b64icon.loadBitmap(TRIANGLE_ICON)
+            if WidgetGrid._dragIcon is None:
+                WidgetGrid._dragIcon = b64icon.loadBitmap(TRIANGLE_ICON)
+
+            self.__dragIcon  = WidgetGrid._dragIcon
             height           = self.__dragIcon.GetSize()[1]
             self.__dragPanel = wx.Window(self)
             self.__dragPanel.SetMinSize((-1, height))
@@ -224,7 +256,10 @@ class WidgetGrid(wx.ScrolledWindow):
         # for all widgets added to the grid.
         # The __widgetRefs array contains the
         # actual widget objects that were passed
-        # to the SetWidget method.
+        # to the SetWidget method. Both are flat
+        # lists in row-major order, i.e. the cell
+        # at (row, col) is at index
+        # (row * ncols + col).
         self.__gridSizer      = None
         self.__nrows          = 0
         self.__ncols          = 0
@@ -234,6 +269,56 @@ class WidgetGrid(wx.ScrolledWindow):
         self.__colLabels      = []
         self.__selected       = None
 
+        # Row/column indices are not stored on
+        # the grid widgets, as they would need
+        # to be updated for every subsequent
+        # row on every call to InsertRow/
+        # DeleteRow. Instead, a {cell panel :
+        # (row, col)} mapping is generated
+        # on-demand by __locationIndex, and
+        # invalidated when rows/columns are
+        # added, removed, or re-ordered.
+        self.__locations      = None
+
+        # Cache of {widget : cell panel}
+        # mappings, used by __getCellPanel.
+        # Cleared whenever a widget is added
+        # to the grid, as the widget may
+        # previously have been in another
+        # cell.
+        self.__cellPanels     = weakref.WeakKeyDictionary()
+
+        # Cache of {widget : bool} values,
+        # recording whether each widget added
+        # to the grid accepts focus. Used by
+        # __onLeftMouseDown.
+        self.__acceptsFocus   = weakref.WeakKeyDictionary()
+
+        # Flags used by __refresh to figure out
+        # what needs to be updated - whether the
+        # grid sizer needs to be re-built, whether
+        # row/column labels need to be shown or
+        # hidden, whether all cell colours need
+        # to be updated, or whether only specific
+        # cells need to be updated.
+        self.__structureDirty = True
+        self.__labelsDirty    = False
+        self.__coloursDirty   = True
+        self.__dirtyCells     = set()
+
+        # Used by Refresh to coalesce
+        # multiple asynchronous refresh
+        # requests into a single refresh.
+        self.__refreshPending = False
+
+        # Used by __scheduleFitInside
+        self.__fitPending = False
+
+        # Used by __onMouseWheel to coalesce
+        # mouse wheel events (see __flushScroll)
+        self.__pendingScroll   = [0, 0]
+        self.__scrollScheduled = False
+
         self.__showRowLabels  = False
         self.__showColLabels  = False
         self.__borderColour   = WidgetGrid._defaultBorderColour
@@ -260,9 +345,12 @@ class WidgetGrid(wx.ScrolledWindow):
             # A silly internal multi-level semaphore
             # used to ignore child focus events when
             # this WidgetGrid generated them.  See
-            # the __selectCell method for more silly
-            # comments.
-            self.__ignoreFocus = 0
+            # the __postSelectEvent method for more
+            # silly comments. The __selectPending
+            # flag is used by __selectCell to
+            # coalesce select events.
+            self.__ignoreFocus   = 0
+            self.__selectPending = False
             self.Bind(wx.EVT_CHILD_FOCUS, self.__onChildFocus)
 
 
@@ -282,15 +370,41 @@ class WidgetGrid(wx.ScrolledWindow):
     @property
     def widgets(self):
         """Returns a list of lists, containing all widgets in the grid.
+        Cells which have not yet been created are ``None``.
         """
-        return [list(row) for row in self.__widgets]
+        ncols = self.__ncols
+        return [self.__widgets[r * ncols:(r + 1) * ncols]
+                for r in range(self.__nrows)]
 
 
-    def Refresh(self):
+    def Refresh(self, sync=True):
         """Redraws the contents of this ``WidgetGrid``. This method must be
         called after the contents of the grid are changed.
+
+        :arg sync: If ``True`` (the default), the grid is refreshed
+                   immediately. Otherwise the refresh is performed on the
+                   next iteration of the ``wx`` event loop via
+                   ``wx.CallAfter`` - multiple asynchronous calls made
+                   before then will only result in a single refresh.
         """
-        self.__refresh()
+
+        if sync:
+            self.__refreshPending = False
+            self.__refresh()
+            return
+
+        if self.__refreshPending:
+            return
+
+        def refresh():
+            if not wutils.isalive(self):
+                return
+            if self.__refreshPending:
+                self.__refreshPending = False
+                self.__refresh()
+
+        self.__refreshPending = True
+        wx.CallAfter(refresh)
 
 
     def __recurse(self, obj, funcname, *args, **kwargs):
@@ -298,16 +412,27 @@ class WidgetGrid(wx.ScrolledWindow):
 
         This really is something which ``wxwidgets`` should be able to do for
         me (e.g. enable/disable a window *and* all of its children).
+
+        The widget hierarchy is traversed iteratively, so deeply nested
+        widgets will not hit the Python recursion limit.
         """
-        if obj is self:
-            func = ft.partial(getattr(wx.ScrolledWindow, funcname), self)
-        else:
-            func = getattr(obj, funcname)
+        stack = [obj]
+
+        while len(stack) > 0:
+
+            obj = stack.pop()
+
+            if obj is self:
+                func = ft.partial(getattr(wx.ScrolledWindow, funcname), self)
+            else:
+                func = getattr(obj, funcname)
 
-        func(*args, **kwargs)
+            func(*args, **kwargs)
 
-        for child in obj.GetChildren():
-            self.__recurse(child, funcname, *args, **kwargs)
+            # Children are pushed in reverse so
+            # they are visited in the same order
+            # as a recursive traversal would.
+            stack.extend(reversed(obj.GetChildren()))
 
 
     def Disable(self):
@@ -356,14 +481,32 @@ class WidgetGrid(wx.ScrolledWindow):
         :arg selected: Background colour for selected cells.
 
         :arg drag:     Background colour for columns being dragged.
+
+        Colours may be specified in any form accepted by ``wx.Colour``, or
+        may be ``None`` to use the default colours.
         """
 
-        border   = kwargs.get('border',   self)
-        label    = kwargs.get('label',    self)
-        odd      = kwargs.get('odd',      self)
-        even     = kwargs.get('even',     self)
-        selected = kwargs.get('selected', self)
-        drag     = kwargs.get('drag',     self)
+        # Colours are converted to wx.Colour
+        # objects up front, so that strings/
+        # tuples do not need to be converted
+        # by wx every time a colour is applied
+        def colour(c):
+            if c is self or c is None: return c
+            else:                      return wx.Colour(c)
+
+        border   = colour(kwargs.get('border',   self))
+        label    = colour(kwargs.get('label',    self))
+        odd      = colour(kwargs.get('odd',      self))
+        even     = colour(kwargs.get('even',     self))
+        selected = colour(kwargs.get('selected', self))
+        drag     = colour(kwargs.get('drag',     self))
+
+        old = (self.__borderColour,
+               self.__labelColour,
+               self.__oddColour,
+               self.__evenColour,
+               self.__selectedColour,
+               self.__dragColour)
 
         if border   is not self: self.__borderColour   = border
         if label    is not self: self.__labelColour    = label
@@ -372,6 +515,21 @@ class WidgetGrid(wx.ScrolledWindow):
         if selected is not self: self.__selectedColour = selected
         if drag     is not self: self.__dragColour     = drag
 
+        new = (self.__borderColour,
+               self.__labelColour,
+               self.__oddColour,
+               self.__evenColour,
+               self.__selectedColour,
+               self.__dragColour)
+
+        # Cell colours only need to be
+        # updated on the next refresh if
+        # any colours have actually changed
+        for o, n in zip(old, new):
+            if (o is None) != (n is None) or (o is not None and o != n):
+                self.__coloursDirty = True
+                break
+
 
     def SetNavKeys(self, **kwargs):
         """Set the keys used for keyboard navigation (if the
@@ -401,7 +559,29 @@ class WidgetGrid(wx.ScrolledWindow):
         onto a location before the limit. Only relevant if
         :data:`WG_DRAGGABLE_COLUMNS` is enabled.
         """
-        self.__dragLimit = limit
+        self.__dragLimit      = limit
+        self.__structureDirty = True
+
+
+    def __scheduleFitInside(self):
+        """Schedules a call to ``FitInside`` on the next iteration of the
+        ``wx`` event loop, unless one is already pending. Used by
+        :meth:`DeleteRow`, so that the virtual size of the grid is only
+        re-calculated once when many rows are deleted.
+        """
+
+        if self.__fitPending:
+            return
+
+        def fit():
+            if not wutils.isalive(self):
+                return
+            if self.__fitPending:
+                self.__fitPending = False
+                self.FitInside()
+
+        self.__fitPending = True
+        wx.CallAfter(fit)
 
 
     def __onResize(self, ev):
@@ -415,20 +595,31 @@ class WidgetGrid(wx.ScrolledWindow):
         """Convenience method which  re-parents the given widget. If
         ``widget`` is a :class:`wx.Sizer` the sizer children are re-parented.
         """
-        if isinstance(widget, wx.Sizer):
-            widget = [c.GetWindow() for c in widget.GetChildren()]
-        else:
-            widget = [widget]
+        if not isinstance(widget, wx.Sizer):
+            widget.Reparent(parent)
+            return
 
-        for w in widget:
-            if w is not None:
-                w.Reparent(parent)
+        # Freeze the new parent while
+        # the sizer children are moved,
+        # so it is only redrawn once
+        parent.Freeze()
+        try:
+            for c in widget.GetChildren():
+                w = c.GetWindow()
+                if w is not None:
+                    w.Reparent(parent)
+        finally:
+            parent.Thaw()
 
 
-    def __setBackgroundColour(self, widget, colour):
+    def __setBackgroundColour(self, widget, colour, refresh=False):
         """Convenience method which changes the background colour of the given
         widget. If ``widget`` is a :class:`wx.Sizer` the background colours of
         the sizer children is updated.
+
+        :arg refresh: If ``True``, ``Refresh`` is called on every widget
+                      whose colour was changed. Widgets which already have
+                      the given colour are not refreshed.
         """
         if isinstance(widget, wx.Sizer):
             widget = [c.GetWindow() for c in widget.GetChildren()]
@@ -436,23 +627,23 @@ class WidgetGrid(wx.ScrolledWindow):
             widget = [widget]
 
         for w in widget:
-            if w is not None:
-                w.SetBackgroundColour(colour)
+            if w is None:
+                continue
 
+            # SetBackgroundColour returns
+            # False if the colour is unchanged
+            if w.SetBackgroundColour(colour) and refresh:
+                w.Refresh()
 
-    def __refresh(self):
-        """Lays out and re-sizes the entire widget grid. """
 
-        borderColour = self.__borderColour
-        labelColour  = self.__labelColour
-        oddColour    = self.__oddColour
-        evenColour   = self.__evenColour
-        ncols        = self.__ncols
+    @_frozen
+    def __refresh(self):
+        """Lays out and re-sizes the widget grid.
 
-        if borderColour is None: borderColour = WidgetGrid._defaultBorderColour
-        if labelColour  is None: labelColour  = WidgetGrid._defaultLabelColour
-        if oddColour    is None: oddColour    = WidgetGrid._defaultOddColour
-        if evenColour   is None: evenColour   = WidgetGrid._defaultEvenColour
+        The sizer is only re-built if the structure of the grid has changed
+        (see :meth:`__refreshStructure`), and cell background colours are
+        only updated on cells which need it (see :meth:`__refreshColours`).
+        """
 
         # Grid is empty
         if self.__gridSizer is None:
@@ -460,94 +651,179 @@ class WidgetGrid(wx.ScrolledWindow):
             self.Layout()
             return
 
-        self.__gridPanel.SetBackgroundColour(borderColour)
+        # If nothing has changed since the
+        # last refresh, no cell colours are
+        # updated, and we only need to lay
+        # out the grid (widget sizes may
+        # have changed)
+        recoloured = self.__structureDirty or \
+                     self.__coloursDirty   or \
+                     len(self.__dirtyCells) > 0
+
+        if self.__structureDirty:
+            self.__refreshStructure()
+        elif self.__labelsDirty:
+            self.__refreshLabels()
+
+        if self.__structureDirty or self.__coloursDirty:
+            self.__refreshColours()
+        elif len(self.__dirtyCells) > 0:
+            self.__refreshColours(self.__dirtyCells)
+
+        self.__structureDirty = False
+        self.__labelsDirty    = False
+        self.__coloursDirty   = False
+        self.__dirtyCells     = set()
+
+        # Re-apply the selection colour, in case
+        # it was overwritten by the above
+        if recoloured and self.__selected is not None:
+            row, col = self.__selected
+            self.__select(row, col, self.__selectable, True)
+
+        self.__fitPending = False
+        self.FitInside()
+        self.Layout()
+
 
-        # Clear the sizer per-item, as the
-        # wx.Sizer.Clear will destroy any
-        # child sizers, and we don't want that
-        for i in reversed(range(self.__gridSizer.GetItemCount())):
-            self.__gridSizer.Detach(i)
+    def __refreshStructure(self):
+        """Called by :meth:`__refresh`. Re-builds the grid sizer. """
+
+        # This method may be looping over
+        # a lot of cells, so we avoid
+        # repeated attribute lookups by
+        # binding everything locally
+        ncols      = self.__ncols
+        gridSizer  = self.__gridSizer
+        addItem    = gridSizer.Add
+        showItem   = gridSizer.Show
+        widgets    = self.__widgets
+        initCell   = self.__initCell
+        showRows   = self.__showRowLabels
+        showCols   = self.__showColLabels
+        colFlags   = self.__columnFlags()
+
+        # wx.Sizer.Clear destroys any child
+        # sizers, but the grid sizer only
+        # contains windows (every cell, including
+        # cells containing a sizer, is embedded
+        # in a panel), and a spacer, so it is
+        # safe to clear in one call.
+        gridSizer.Clear(delete_windows=False)
 
         # empty cell in top left of grid
-        self.__gridSizer.Add((-1, -1), flag=wx.EXPAND)
+        addItem((-1, -1), flag=wx.EXPAND)
 
         # column labels
         for coli, (lblPanel, colLabel) in enumerate(self.__colLabels):
 
-            lblPanel._wg_row = -1
-            lblPanel._wg_col = coli
-            colLabel._wg_row = -1
-            colLabel._wg_col = coli
-
-            # If drag limit is set, add a border
-            # between the last draggable column,
-            # unless all columns are draggable.
-            if (coli == self.__dragLimit) and (coli < ncols - 1):
-                flag   = wx.EXPAND | wx.RIGHT
-                border = 2
-            else:
-                flag   = wx.EXPAND
-                border = 0
-
-            lblPanel.SetBackgroundColour(labelColour)
-            colLabel.SetBackgroundColour(labelColour)
+            flag, border = colFlags[coli]
 
-            self.__gridSizer.Add( lblPanel, border=border, flag=flag)
-            self.__gridSizer.Show(lblPanel, self.__showColLabels)
+            addItem( lblPanel, border=border, flag=flag)
+            showItem(lblPanel, showCols)
 
         # Rows
         for rowi, (lblPanel, rowLabel) in enumerate(self.__rowLabels):
 
-            lblPanel._wg_row = rowi
-            lblPanel._wg_col = -1
-            rowLabel._wg_row = rowi
-            rowLabel._wg_col = -1
+            addItem( lblPanel, flag=wx.EXPAND)
+            showItem(lblPanel, showRows)
 
-            if rowi == self.__nrows - 1: flag = wx.TOP | wx.LEFT | wx.BOTTOM
-            else:                        flag = wx.TOP | wx.LEFT
+            # Widgets
+            idx = rowi * ncols
+            for coli, (flag, border) in enumerate(colFlags):
 
-            lblPanel.SetBackgroundColour(labelColour)
-            rowLabel.SetBackgroundColour(labelColour)
+                # Create placeholders for
+                # any cells which are empty
+                if widgets[idx] is None:
+                    initCell(rowi, coli)
 
-            self.__gridSizer.Add( lblPanel, flag=wx.EXPAND)
-            self.__gridSizer.Show(lblPanel, self.__showRowLabels)
+                container = widgets[idx]
+                idx      += 1
 
-            # Widgets
-            for coli in range(self.__ncols):
+                addItem(container, flag=flag, border=border, proportion=1)
 
-                widget    = self.__widgetRefs[rowi][coli]
-                container = self.__widgets[   rowi][coli]
 
-                widget   ._wg_row = rowi
-                widget   ._wg_col = coli
-                container._wg_row = rowi
-                container._wg_col = coli
+    def __columnFlags(self):
+        """Returns a list containing the ``(flag, border)`` sizer settings
+        to use for the cells in each column.
+        """
 
-                # border at drag limit
-                if (coli == self.__dragLimit) and (coli < ncols - 1):
-                    flag   = wx.EXPAND | wx.RIGHT
-                    border = 2
-                else:
-                    flag   = wx.EXPAND
-                    border = 0
+        # If drag limit is set, add a border
+        # between the last draggable column,
+        # unless all columns are draggable.
+        ncols    = self.__ncols
+        colFlags = [(wx.EXPAND, 0)] * ncols
 
-                self.__gridSizer.Add(container,
-                                     flag=flag,
-                                     border=border,
-                                     proportion=1)
+        if 0 <= self.__dragLimit < ncols - 1:
+            colFlags[self.__dragLimit] = (wx.EXPAND | wx.RIGHT, 2)
 
-                if rowi % 2: colour = oddColour
-                else:        colour = evenColour
+        return colFlags
 
-                self.__setBackgroundColour(container, colour)
-                self.__setBackgroundColour(widget,    colour)
 
-        if self.__selected is not None:
-            row, col = self.__selected
-            self.SetSelection(row, col)
+    def __refreshLabels(self):
+        """Called by :meth:`__refresh`. Shows/hides the row and column
+        labels, without re-building the grid sizer.
+        """
 
-        self.FitInside()
-        self.Layout()
+        gridSizer = self.__gridSizer
+        showRows  = self.__showRowLabels
+        showCols  = self.__showColLabels
+
+        for lblPanel, _ in self.__colLabels:
+            gridSizer.Show(lblPanel, showCols)
+
+        for lblPanel, _ in self.__rowLabels:
+            gridSizer.Show(lblPanel, showRows)
+
+
+    def __refreshColours(self, cells=None):
+        """Called by :meth:`__refresh`. Updates the background colours of
+        grid cells.
+
+        :arg cells: Sequence of ``(row, col)`` indices specifying the cells
+                    to update. If not provided, the colours of all cells and
+                    labels are updated.
+        """
+
+        borderColour = self.__borderColour
+        labelColour  = self.__labelColour
+        oddColour    = self.__oddColour
+        evenColour   = self.__evenColour
+
+        if borderColour is None: borderColour = WidgetGrid._defaultBorderColour
+        if labelColour  is None: labelColour  = WidgetGrid._defaultLabelColour
+        if oddColour    is None: oddColour    = WidgetGrid._defaultOddColour
+        if evenColour   is None: evenColour   = WidgetGrid._defaultEvenColour
+
+        if cells is None:
+
+            self.__gridPanel.SetBackgroundColour(borderColour)
+
+            for lblPanel, label in self.__colLabels + self.__rowLabels:
+                lblPanel.SetBackgroundColour(labelColour)
+                label   .SetBackgroundColour(labelColour)
+
+            cells = ((r, c) for r in range(self.__nrows)
+                            for c in range(self.__ncols))
+
+        ncols      = self.__ncols
+        widgets    = self.__widgets
+        widgetRefs = self.__widgetRefs
+        setColour  = self.__setBackgroundColour
+        colours    = (evenColour, oddColour)
+
+        for rowi, coli in cells:
+
+            idx       = rowi * ncols + coli
+            container = widgets[idx]
+
+            if container is None:
+                continue
+
+            colour = colours[rowi % 2]
+
+            setColour(container,       colour)
+            setColour(widgetRefs[idx], colour)
 
 
     def GetGridSize(self):
@@ -556,6 +832,7 @@ class WidgetGrid(wx.ScrolledWindow):
         return self.__nrows, self.__ncols
 
 
+    @_frozen
     def SetGridSize(self, nrows, ncols, growCols=None):
         """Set the size of the widdget grid. The :meth:`Refresh` method must
         be called afterwards for this method to take effect.
@@ -582,6 +859,7 @@ class WidgetGrid(wx.ScrolledWindow):
         self.__nrows     = nrows
         self.__ncols     = ncols
         self.__dragLimit = -1
+        self.__locations = None
 
         # set hgap and vgap so we get
         # a 1px border between cells
@@ -591,15 +869,17 @@ class WidgetGrid(wx.ScrolledWindow):
         for col in growCols:
             self.__gridSizer.AddGrowableCol(col + 1)
 
-        self.__widgets    = [[None] * ncols for i in range(nrows)]
-        self.__widgetRefs = [[None] * ncols for i in range(nrows)]
+        self.__widgets    = [None] * (nrows * ncols)
+        self.__widgetRefs = [None] * (nrows * ncols)
         self.__rowLabels  =  [None] * nrows
         self.__colLabels  =  [None] * ncols
 
-        for rowi in range(nrows):
-            for coli in range(ncols):
-                self.__initCell(rowi, coli)
-
+        # Placeholders for empty cells are
+        # created on-demand (see GetWidget
+        # and __refreshStructure), as most
+        # of them will usually be replaced
+        # via SetWidget/SetText before the
+        # grid is displayed.
         for rowi in range(nrows): self.__initRowLabel(rowi)
         for coli in range(ncols): self.__initColLabel(coli)
 
@@ -618,12 +898,18 @@ class WidgetGrid(wx.ScrolledWindow):
 
 
     def __initCell(self, row, col):
-        """Called by :meth:`SetGridSize` and :meth:`InsertRow`. Creates a
-        placeholder ``wx.Panel`` at the specified cell.
+        """Called by :meth:`GetWidget`, :meth:`__refreshStructure` and
+        :meth:`__insertRowItems`. Creates a placeholder ``wx.Panel`` at the
+        specified cell.
         """
         placeholder = wx.Panel(self.__gridPanel)
-        self.__widgets[   row][col] = placeholder
-        self.__widgetRefs[row][col] = placeholder
+
+        idx                    = row * self.__ncols + col
+        self.__widgets[   idx] = placeholder
+        self.__widgetRefs[idx] = placeholder
+
+        if self.__locations is not None:
+            self.__locations[placeholder] = (row, col)
 
 
     def __initRowLabel(self, row):
@@ -636,16 +922,16 @@ class WidgetGrid(wx.ScrolledWindow):
             panel,
             style=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
 
-        # See comment in SetWidget
-        panel._wg_cell = True
-
         panel.SetSizer(sizer)
         sizer.Add(lbl, flag=wx.CENTRE)
 
-        self.__initWidget(panel, row, -1)
-        self.__initWidget(lbl,   row, -1)
+        self.__initWidget(panel)
+        self.__initWidget(lbl)
         self.__rowLabels[row] = (panel, lbl)
 
+        if self.__locations is not None:
+            self.__locations[panel] = (row, -1)
+
 
     def __initColLabel(self, col):
         """Called by :meth:`SetGridSize`. Creates a label widget at the
@@ -657,14 +943,11 @@ class WidgetGrid(wx.ScrolledWindow):
             panel,
             style=wx.ALIGN_CENTRE_HORIZONTAL | wx.ALIGN_CENTRE_VERTICAL)
 
-        # See comment in SetWidget
-        panel._wg_cell = True
-
         panel.SetSizer(sizer)
         sizer.Add(label, flag=wx.CENTRE)
 
-        self.__initWidget(panel, -1, col)
-        self.__initWidget(label, -1, col)
+        self.__initWidget(panel)
+        self.__initWidget(label)
         self.__colLabels[col] = (panel, label)
 
         if self.__draggable:
@@ -679,34 +962,95 @@ class WidgetGrid(wx.ScrolledWindow):
     def __getCellPanel(self, widget):
         """Returns the parent ``wx.Panel`` for the given ``widget``, or
         ``None`` if the widget is not in the grid.
+
+        The result of the search is cached, as this method is called on
+        every focus/mouse event on a grid widget.
         """
 
-        while widget is not None:
+        if widget is None:
+            return None
+
+        panel = self.__cellPanels.get(widget, None)
+
+        if panel is not None:
+            return panel
+
+        panel     = widget
+        locations = self.__locationIndex()
 
-            if hasattr(widget, '_wg_cell'):
+        while panel is not None:
+
+            if panel in locations:
                 break
 
-            widget = widget.GetParent()
+            panel = panel.GetParent()
+
+        # Don't cache cell panels against
+        # themselves, as the (strong) value
+        # would keep the (weak) key alive
+        if panel is not None and panel is not widget:
+            self.__cellPanels[widget] = panel
+
+        return panel
+
+
+    def __locationIndex(self):
+        """Returns a dictionary of ``{panel : (row, col)}`` mappings,
+        containing the location of every cell/label panel in the grid. The
+        dictionary is created on the first call after rows/columns have been
+        inserted, deleted, or re-ordered, and then cached.
+        """
+
+        if self.__locations is not None:
+            return self.__locations
+
+        locations = {}
+        ncols     = self.__ncols
+        widgets   = self.__widgets
+
+        for coli, (lblPanel, _) in enumerate(self.__colLabels):
+            locations[lblPanel] = (-1, coli)
 
-        return widget
+        for rowi, (lblPanel, _) in enumerate(self.__rowLabels):
+            locations[lblPanel] = (rowi, -1)
+            for coli in range(ncols):
+                container = widgets[rowi * ncols + coli]
+                if container is not None:
+                    locations[container] = (rowi, coli)
+
+        self.__locations = locations
+
+        return locations
+
+
+    def __getCellLocation(self, widget):
+        """Returns the ``(row, column)`` location of the cell which contains
+        the given ``widget``, or ``None`` if the widget is not in the grid.
+        The row/column may be ``-1`` for row/column labels.
+        """
+        panel = self.__getCellPanel(widget)
+        return self.__locationIndex().get(panel, None)
 
 
     def GetRow(self, widget):
         """Returns the index of the row in which the given ``widget`` is
         located, or ``-1`` if it is not in the ``WidgetGrid``.
         """
-        try:                   return widget._wg_row
-        except AttributeError: return -1
+        loc = self.__getCellLocation(widget)
+        if loc is None: return -1
+        else:           return loc[0]
 
 
     def GetColumn(self, widget):
         """Returns the index of the column in which the given ``widget`` is
         located, or ``-1`` if it is not in the ``WidgetGrid``.
         """
-        try:                   return widget._wg_col
-        except AttributeError: return -1
+        loc = self.__getCellLocation(widget)
+        if loc is None: return -1
+        else:           return loc[1]
 
 
+    @_frozen
     def DeleteRow(self, row):
         """Removes the specified ``row`` from the grid, destroying all
         widgets on that row. This method does not need to be followed
@@ -723,34 +1067,33 @@ class WidgetGrid(wx.ScrolledWindow):
         if row < 0 or row >= self.__nrows:
             raise ValueError(f'Invalid row index {row}')
 
+        # Sizer index of the row label
+        base = (row + 1) * (self.__ncols + 1)
+
         log.debug('Deleting row %s (sizer indices %s - %s)',
-            row,
-            (row + 1) * (self.__ncols + 1),
-            (row + 1) * (self.__ncols + 1) + self.__ncols)
+                  row, base, base + self.__ncols)
 
         # Remove from the grid
         for col in reversed(range(self.__ncols + 1)):
-            self.__gridSizer.Detach((row + 1) * (self.__ncols + 1) + col)
+            self.__gridSizer.Detach(base + col)
 
-        # Update row/col references
-        # on all widgets/labels
-        for ri in range(row, self.__nrows):
-            for ci in range(self.__ncols):
-                self.__widgetRefs[ri][ci]._wg_row -= 1
-                self.__widgets[   ri][ci]._wg_row -= 1
-
-            self.__rowLabels[ri][0]._wg_row -= 1
-            self.__rowLabels[ri][1]._wg_row -= 1
+        # The row indices of all
+        # subsequent rows have changed
+        self.__locations = None
 
         # Destroy the widgets and the row label
-        for widget in self.__widgets[row]:
-            widget.Destroy()
+        start = row       * self.__ncols
+        end   = (row + 1) * self.__ncols
+
+        for widget in self.__widgets[start:end]:
+            if widget is not None:
+                widget.Destroy()
 
         self.__rowLabels .pop(row)[0].Destroy()
 
         # Remove references to them
-        self.__widgetRefs.pop(row)
-        self.__widgets   .pop(row)
+        del self.__widgetRefs[start:end]
+        del self.__widgets[   start:end]
 
         # Update the grid
         self.__nrows -= 1
@@ -762,9 +1105,17 @@ class WidgetGrid(wx.ScrolledWindow):
             if   srow == row:             self.__selected = None
             elif srow > row and srow > 0: self.__selected = (srow - 1, scol)
 
-        self.FitInside()
+        # The odd/even colours of all
+        # subsequent rows need updating
+        self.__setRowsDirty(row)
+
+        # Callers often delete many rows
+        # at once, so the scrollbars are
+        # updated asynchronously
+        self.__scheduleFitInside()
 
 
+    @_frozen
     def InsertRow(self, row):
         """Inserts a new row into the ``WidgetGrid`` at the specified ``row``
         index. This method must be followed by a call to :meth:`Refresh`.
@@ -784,27 +1135,28 @@ class WidgetGrid(wx.ScrolledWindow):
         # Add empty label/cell
         # values for the new row
         self.__rowLabels .insert(row,  None)
-        self.__widgets   .insert(row, [None] * self.__ncols)
-        self.__widgetRefs.insert(row, [None] * self.__ncols)
+        idx = row * self.__ncols
+        self.__widgets[   idx:idx] = [None] * self.__ncols
+        self.__widgetRefs[idx:idx] = [None] * self.__ncols
 
         # Update the grid
-        self.__nrows += 1
+        self.__nrows     += 1
+        self.__locations  = None
         self.__gridSizer.SetRows(self.__nrows + 1)
 
-        # Initialise the contents
-        # of the new row
+        # Initialise the new row label - cell
+        # placeholders are created on-demand
         self.__initRowLabel(row)
-        for col in range(self.__ncols):
-            self.__initCell(row, col)
 
-        # update row/col indices
-        for ri in range(row + 1, self.__nrows):
-            for ci in range(self.__ncols):
-                self.__widgetRefs[ri][ci]._wg_row += 1
-                self.__widgets[   ri][ci]._wg_row += 1
-
-            self.__rowLabels[ri][0]._wg_row += 1
-            self.__rowLabels[ri][1]._wg_row += 1
+        # If the grid sizer is up to date, the
+        # new row can be inserted directly into
+        # it, rather than the whole sizer being
+        # re-built on the next refresh. The new
+        # row, and the odd/even colours of all
+        # subsequent rows, need updating.
+        if not self.__structureDirty:
+            self.__insertRowItems(row)
+            self.__setRowsDirty(row)
 
         # Update selected widget if necessary
         if self.__selected is not None:
@@ -814,6 +1166,64 @@ class WidgetGrid(wx.ScrolledWindow):
                 self.__selected = (srow + 1, scol)
 
 
+    def __insertRowItems(self, row):
+        """Called by :meth:`InsertRow`. Creates placeholder cells for the
+        given (newly inserted) row, and inserts them, along with the row
+        label, into the grid sizer.
+        """
+
+        gridSizer = self.__gridSizer
+        ncols     = self.__ncols
+        widgets   = self.__widgets
+        lblPanel  = self.__rowLabels[row][0]
+
+        # Sizer index of the row label - the
+        # first sizer row contains a spacer
+        # and the column labels
+        sizerIdx = (row + 1) * (ncols + 1)
+
+        gridSizer.Insert(sizerIdx, lblPanel, flag=wx.EXPAND)
+        gridSizer.Show(lblPanel, self.__showRowLabels)
+
+        labelColour = self.__labelColour
+        if labelColour is None:
+            labelColour = WidgetGrid._defaultLabelColour
+
+        for widget in self.__rowLabels[row]:
+            widget.SetBackgroundColour(labelColour)
+
+        for coli, (flag, border) in enumerate(self.__columnFlags()):
+
+            self.__initCell(row, coli)
+
+            gridSizer.Insert(sizerIdx + coli + 1,
+                             widgets[row * ncols + coli],
+                             flag=flag,
+                             border=border,
+                             proportion=1)
+
+
+    def __setRowsDirty(self, row):
+        """Called by :meth:`InsertRow` and :meth:`DeleteRow`. Marks the
+        cells on the given row, and on all subsequent rows, as needing their
+        colours updated on the next refresh, as inserting/deleting a row
+        changes the odd/even colouring of all rows after it.
+        """
+
+        # Any existing entries for these rows
+        # refer to their old row indices, so
+        # are discarded and replaced
+        ncols = self.__ncols
+        dirty = {(r, c) for r, c in self.__dirtyCells if r < row}
+
+        dirty.update((r, c)
+                     for r in range(row, self.__nrows)
+                     for c in range(ncols))
+
+        self.__dirtyCells = dirty
+
+
+    @_frozen
     def ClearGrid(self):
         """Removes and destroys all widgets from the grid, and sets the grid
         size to ``(0, 0)``. The :meth:`Refresh` method must be called
@@ -832,6 +1242,12 @@ class WidgetGrid(wx.ScrolledWindow):
         self.__rowLabels  = []
         self.__colLabels  = []
         self.__selected   = None
+        self.__locations  = None
+        self.__cellPanels.clear()
+
+        self.__structureDirty = True
+        self.__coloursDirty   = True
+        self.__dirtyCells     = set()
 
         self.__gridPanel.SetSizer(None)
 
@@ -841,7 +1257,10 @@ class WidgetGrid(wx.ScrolledWindow):
         with the given text, and passes it to the :meth:`SetWidget` method.
 
         If there is already a ``wx.StaticText`` widget at the given
-        ``row``/``col``, it is re-used, and its label simply updated.
+        ``row``/``col``, it is re-used, and its label simply updated. In
+        this case, only the cell is re-laid out - a call to :meth:`Refresh`
+        is only needed if the new label does not fit in the current column
+        width.
 
         :arg row:  Row index.
 
@@ -850,10 +1269,14 @@ class WidgetGrid(wx.ScrolledWindow):
         :arg text: Text to display.
         """
 
-        txt = self.GetWidget(row, col)
+        # Don't use GetWidget, as we don't
+        # want a placeholder to be created
+        txt = self.__widgetRefs[self.__cellIndex(row, col)]
 
         if isinstance(txt, wx.StaticText):
-            txt.SetLabel(text)
+            if txt.GetLabel() != text:
+                txt.SetLabel(text)
+                txt.GetParent().Layout()
         else:
             txt = wx.StaticText(self.__gridPanel,
                                 label=text,
@@ -864,7 +1287,28 @@ class WidgetGrid(wx.ScrolledWindow):
     def GetWidget(self, row, col):
         """Returns the widget located at the specified row/column. """
 
-        return self.__widgetRefs[row][col]
+        idx = self.__cellIndex(row, col)
+
+        if self.__widgets[idx] is None:
+            self.__initCell(row, col)
+
+        return self.__widgetRefs[idx]
+
+
+    def __cellIndex(self, row, col):
+        """Returns the index into the ``__widgets`` and ``__widgetRefs``
+        lists for the cell at the given ``row`` and ``col``.
+
+        Raises an :exc:`IndexError` if the specified grid location ``(row,
+        col)`` is invalid.
+        """
+        if row <  0            or \
+           col <  0            or \
+           row >= self.__nrows or \
+           col >= self.__ncols:
+            raise IndexError(f'Grid location ({row}, {col}) out of bounds '
+                             f'({self.__nrows}, {self.__ncols})')
+        return row * self.__ncols + col
 
 
     def SetWidget(self, row, col, widget):
@@ -886,12 +1330,7 @@ class WidgetGrid(wx.ScrolledWindow):
         Raises an :exc:`IndexError` if the specified grid location ``(row,
         col)`` is invalid.
         """
-        if row <  0            or \
-           col <  0            or \
-           row >= self.__nrows or \
-           col >= self.__ncols:
-            raise IndexError(f'Grid location ({row}, {col}) out of bounds '
-                             f'({self.__nrows}, {self.__ncols})')
+        idx = self.__cellIndex(row, col)
 
         # Embed the widget in a panel,
         # as Linux/GTK has trouble
@@ -901,50 +1340,56 @@ class WidgetGrid(wx.ScrolledWindow):
         sizer = wx.BoxSizer(wx.HORIZONTAL)
         panel.SetSizer(sizer)
 
-        # Put a marker on the cell panel
-        # so the __gelCellPanel method
-        # can identify it - cell panels
-        # are used in certain event
-        # handlers (e.g. __onColumnLabelMouse*)
-        panel._wg_cell = True
-
+        self.__cellPanels.clear()
         self.__reparent(widget, panel)
 
-        self.__initWidget(widget, row, col)
-        self.__initWidget(panel,  row, col)
+        self.__initWidget(widget)
+        self.__initWidget(panel)
 
         sizer.Add(widget, flag=wx.EXPAND, proportion=1)
 
-        if self.__widgets[row][col] is not None:
-            self.__widgets[row][col].Destroy()
+        # If the grid sizer has already been
+        # built, we can just swap the new cell
+        # panel in, rather than re-building
+        # the whole sizer on the next refresh.
+        old = self.__widgets[idx]
 
-        self.__widgetRefs[row][col] = widget
-        self.__widgets[   row][col] = panel
+        if old is not None:
+            if self.__structureDirty or \
+               not self.__gridSizer.Replace(old, panel):
+                self.__structureDirty = True
+            old.Destroy()
 
+        self.__widgetRefs[idx] = widget
+        self.__widgets[   idx] = panel
+        self.__dirtyCells.add((row, col))
 
-    def __initWidget(self, widget, row, col):
-        """Called by the :meth:`AddWidget` method.
+        if self.__locations is not None:
+            self.__locations.pop(old, None)
+            self.__locations[panel] = (row, col)
 
-        Performs some initialisation on a widget which has just been added to
-        the grid.
 
-        :arg widget: The widget to initialise
-        :arg row:    Row index of the widget in the grid.
-        :arg col:    Column index of the widget in the grid.
+    @_frozen
+    def SetWidgets(self, widgets):
+        """Adds multiple widgets to the grid. This is equivalent to calling
+        :meth:`SetWidget` for each widget, but the grid is frozen while the
+        widgets are added. The :meth:`Refresh` method must be called
+        afterwards for this method to take effect.
+
+        :arg widgets: Sequence of ``(row, col, widget)`` tuples.
         """
+        for row, col, widget in widgets:
+            self.SetWidget(row, col, widget)
 
-        def scroll(ev):
-            posx, posy = self.GetViewStart()
-            rotation   = ev.GetWheelRotation()
 
-            if   rotation > 0: delta =  5
-            elif rotation < 0: delta = -5
-            else:              return
+    def __initWidget(self, widget):
+        """Called by the :meth:`SetWidget` method.
 
-            if ev.GetWheelAxis() == wx.MOUSE_WHEEL_VERTICAL: posy -= delta
-            else:                                            posx += delta
+        Performs some initialisation on a widget which has just been added to
+        the grid.
 
-            self.Scroll(posx, posy)
+        :arg widget: The widget to initialise
+        """
 
         def initWidget(w):
 
@@ -953,18 +1398,15 @@ class WidgetGrid(wx.ScrolledWindow):
             # for scrolling to work correctly. This is not
             # necessary under OSX/cocoa.
             if wx.Platform == '__WXGTK__':
-                w.Bind(wx.EVT_MOUSEWHEEL, scroll)
+                w.Bind(wx.EVT_MOUSEWHEEL, self.__onMouseWheel)
 
             # Listen for mouse down events
             # if cells are selectable
-            if self.__selectable and not w.AcceptsFocus():
-                w.Bind(wx.EVT_LEFT_DOWN, self.__onLeftMouseDown)
-
-            # Attach the row/column indices to the
-            # widget - they are used in the
-            # __onLeftDown and __onChildFocus methods
-            w._wg_row = row
-            w._wg_col = col
+            if self.__selectable:
+                accepts                = w.AcceptsFocus()
+                self.__acceptsFocus[w] = accepts
+                if not accepts:
+                    w.Bind(wx.EVT_LEFT_DOWN, self.__onLeftMouseDown)
 
         if isinstance(widget, wx.Sizer):
             for c in widget.GetChildren():
@@ -975,22 +1417,96 @@ class WidgetGrid(wx.ScrolledWindow):
             initWidget(widget)
 
 
+    def __onMouseWheel(self, ev):
+        """Called on mouse wheel events on widgets in the grid (under GTK
+        only - see :meth:`__initWidget`). Scrolls the grid.
+
+        Mouse wheel/trackpad events can arrive at a very high rate, so
+        rather than scrolling on every event, scroll deltas are accumulated,
+        and the grid is scrolled once every 16 milliseconds (see
+        :meth:`__flushScroll`).
+        """
+        rotation = ev.GetWheelRotation()
+
+        if   rotation > 0: delta =  5
+        elif rotation < 0: delta = -5
+        else:              return
+
+        if ev.GetWheelAxis() == wx.MOUSE_WHEEL_VERTICAL:
+            self.__pendingScroll[1] -= delta
+        else:
+            self.__pendingScroll[0] += delta
+
+        if not self.__scrollScheduled:
+            self.__scrollScheduled = True
+            wx.CallLater(16, self.__flushScroll)
+
+
+    def __flushScroll(self):
+        """Called by :meth:`__onMouseWheel`. Scrolls the grid by the
+        accumulated scroll delta.
+        """
+
+        if not wutils.isalive(self):
+            return
+
+        dx, dy     = self.__pendingScroll
+        posx, posy = self.GetViewStart()
+
+        self.__pendingScroll   = [0, 0]
+        self.__scrollScheduled = False
+
+        self.Scroll(posx + dx, posy + dy)
+
+
     def __selectCell(self, row, col):
         """Called by the :meth:`__onChildFocus` and :meth:`__onLeftMouseDown`
         methods. Selects the specified row/column, and generates an
         :data:`EVT_WG_SELECT` event.
+
+        The selection is changed immediately, but the event is generated
+        asynchronously - if the selection changes several times before
+        then (e.g. while an arrow key is held down), only one event is
+        generated, for the final selection.
         """
 
         if   self.__selectable == 'rows':    col = -1
         elif self.__selectable == 'columns': row = -1
 
-        try:
-            if not self.SetSelection(row, col):
-                return
+        # e.g. a click on a row/column
+        # label when cells are selectable
+        if self.__selectionError(row, col) is not None:
+            return
+
+        if not self.SetSelection(row, col):
+            return
 
-        except ValueError:
+        # An event has already been scheduled
+        # - it will contain the new selection
+        if self.__selectPending:
             return
 
+        self.__selectPending = True
+        wx.CallAfter(self.__postSelectEvent)
+
+
+    def __postSelectEvent(self):
+        """Called via ``wx.CallAfter`` by :meth:`__selectCell`. Generates an
+        :data:`EVT_WG_SELECT` event for the current selection.
+        """
+
+        if not wutils.isalive(self):
+            return
+
+        self.__selectPending = False
+
+        # The selection may have been
+        # cleared in the meantime
+        if self.__selected is None:
+            return
+
+        row, col = self.__selected
+
         log.debug('Posting grid select event (%s, %s)', row, col)
 
         # This is a ridiculous workaround to a
@@ -1013,17 +1529,23 @@ class WidgetGrid(wx.ScrolledWindow):
         # to tell the __onChildFocus method to
         # do nothing while any grid select event
         # handlers are running.
+        #
+        # This method is already called
+        # asynchronously (see __selectCell), so
+        # we use ProcessEvent rather than
+        # wx.PostEvent - the event handlers are
+        # run immediately, and we can reset the
+        # flag as soon as they have finished.
         self.__ignoreFocus += 1
 
-        event = WidgetGridSelectEvent(row=row, col=col)
-        event.SetEventObject(self)
-        wx.PostEvent(self, event)
+        try:
+            event = WidgetGridSelectEvent(row=row, col=col)
+            event.SetEventObject(self)
+            self.GetEventHandler().ProcessEvent(event)
 
-        def resetFocus():
+        finally:
             self.__ignoreFocus -= 1
 
-        wx.CallAfter(resetFocus)
-
 
     def __onChildFocus(self, ev):
         """If this ``WidgetGrid`` is selectable, this method is called when a
@@ -1045,25 +1567,14 @@ class WidgetGrid(wx.ScrolledWindow):
         if self.__ignoreFocus > 0:
             return
 
-        gridWidget = ev.GetEventObject()
-
-        row = None
-        col = None
-
         # The event source may be a child of the
-        # widget that was added to the grid, so we
-        # search up the hierarchy to find the
-        # parent that has row and column attributes
-        while gridWidget is not None:
-
-            if hasattr(gridWidget, '_wg_row'):
-                row = gridWidget._wg_row
-                col = gridWidget._wg_col
-                break
-            else:
-                gridWidget = gridWidget.GetParent()
+        # widget that was added to the grid -
+        # __getCellLocation searches up the
+        # hierarchy to find the cell panel.
+        loc = self.__getCellLocation(ev.GetEventObject())
 
-        if row is not None and col is not None:
+        if loc is not None:
+            row, col = loc
             log.debug('Focus on cell (%s, %s)', row, col)
             self.__selectCell(row, col)
 
@@ -1074,13 +1585,21 @@ class WidgetGrid(wx.ScrolledWindow):
         """
 
         widget = ev.GetEventObject()
-        row    = widget._wg_row
-        col    = widget._wg_col
+        loc    = self.__getCellLocation(widget)
+
+        if loc is None:
+            return
+
+        row, col = loc
 
         # Make sure the panel has focus; this
         # will result in a call to __onChildFocus,
         # so tell it not to emit an event
-        if not widget.AcceptsFocus():
+        accepts = self.__acceptsFocus.get(widget, None)
+        if accepts is None:
+            accepts = widget.AcceptsFocus()
+
+        if not accepts:
             self.__ignoreFocus += 1
             self.SetFocusIgnoringChildren()
             self.__ignoreFocus -= 1
@@ -1124,10 +1643,14 @@ class WidgetGrid(wx.ScrolledWindow):
 
         row, col = self.__selected
 
-        if   key == up:    row -= 1
-        elif key == down:  row += 1
-        elif key == left:  col -= 1
-        elif key == right: col += 1
+        # Clamp to the grid bounds - if the
+        # selection is already at the edge,
+        # SetSelection will see that it is
+        # unchanged and return immediately.
+        if   key == up:    row = max(row - 1, 0)
+        elif key == down:  row = min(row + 1, self.__nrows - 1)
+        elif key == left:  col = max(col - 1, 0)
+        elif key == right: col = min(col + 1, self.__ncols - 1)
 
         log.debug('Keyboard nav on cell %s (new cell: '
                   '(%s, %s))', self.__selected, row, col)
@@ -1160,22 +1683,10 @@ class WidgetGrid(wx.ScrolledWindow):
         if self.__selected == (row, col):
             return False
 
-        nrows, ncols = self.GetGridSize()
-
-        if self.__selectable == 'rows':
-
-            if col != -1 or row < 0 or row >= nrows:
-                raise ValueError(f'Invalid row: {row}')
-
-        elif self.__selectable == 'columns':
-
-            if row != -1 or col < 0 or col >= ncols:
-                raise ValueError(f'Invalid column: {col}')
+        error = self.__selectionError(row, col)
 
-        elif self.__selectable == 'cells':
-
-            if row < 0 or row >= nrows or col < 0 or col >= ncols:
-                raise ValueError(f'Invalid cell: {row}, {col}')
+        if error is not None:
+            raise ValueError(error)
 
         if self.__selected is not None:
 
@@ -1191,6 +1702,34 @@ class WidgetGrid(wx.ScrolledWindow):
         return True
 
 
+    def __selectionError(self, row, col):
+        """Called by :meth:`SetSelection` and :meth:`__selectCell`. Checks
+        whether the given ``(row, col)`` is a valid selection.
+
+        :returns: ``None`` if the selection is valid, or an error message
+                  otherwise.
+        """
+
+        nrows, ncols = self.__nrows, self.__ncols
+
+        if self.__selectable == 'rows':
+
+            if col != -1 or row < 0 or row >= nrows:
+                return f'Invalid row: {row}'
+
+        elif self.__selectable == 'columns':
+
+            if row != -1 or col < 0 or col >= ncols:
+                return f'Invalid column: {col}'
+
+        elif self.__selectable == 'cells':
+
+            if row < 0 or row >= nrows or col < 0 or col >= ncols:
+                return f'Invalid cell: {row}, {col}'
+
+        return None
+
+
     def __scrollTo(self, row, col):
         """If scrolling is enabled, this method makes sure that the specified
         row/column is visible.
@@ -1203,12 +1742,19 @@ class WidgetGrid(wx.ScrolledWindow):
         if row == -1: row = 0
         if col == -1: col = 0
 
+        container = self.__widgets[row * self.__ncols + col]
+
+        # The cell has not yet been
+        # created/laid out
+        if container is None:
+            return
+
         # We're assuming that the
         # scroll rate is in pixels
-        startx,    starty    = self                    .GetViewStart()
-        sizex,     sizey     = self                    .GetClientSize()
-        posx,      posy      = self.__widgets[row][col].GetPosition()
-        widgSizex, widgSizey = self.__widgets[row][col].GetSize()
+        startx,    starty    = self     .GetViewStart()
+        sizex,     sizey     = self     .GetClientSize()
+        posx,      posy      = container.GetPosition()
+        widgSizex, widgSizey = container.GetSize()
 
         # Take into account the size
         # of the widget in the cell
@@ -1236,11 +1782,15 @@ class WidgetGrid(wx.ScrolledWindow):
             self.Scroll(scrollx, scrolly)
 
 
+    @_frozen
     def __select(self, row, col, selectType, select=True):
         """Called by the :meth:`SetSelection` method. Sets the background
         colour of the specified row/column to the selection colour, or the
         default colour.
 
+        The grid is frozen while colours are changed, so all of the affected
+        cells are re-painted at once.
+
         :arg row:        Row index. If -1, the colour of the entire column is
                          toggled.
 
@@ -1254,7 +1804,7 @@ class WidgetGrid(wx.ScrolledWindow):
                          colour.
         """
 
-        nrows, ncols = self.GetGridSize()
+        nrows, ncols = self.__nrows, self.__ncols
 
         if row == -1 and col == -1:
             return
@@ -1262,44 +1812,60 @@ class WidgetGrid(wx.ScrolledWindow):
         if nrows == 0 or ncols == 0:
             return
 
-        if row == -1:
-            rows = range(nrows)
-            cols = [col] * nrows
+        if   row == -1: cells = zip(range(nrows), it.repeat(col))
+        elif col == -1: cells = zip(it.repeat(row), range(ncols))
+        else:           cells = [(row, col)]
 
-        elif col == -1:
-            rows = [row] * ncols
-            cols = range(ncols)
+        selectedColour = self.__selectedColour
+        oddColour      = self.__oddColour
+        evenColour     = self.__evenColour
 
-        else:
-            rows = [row]
-            cols = [col]
+        if selectedColour is None:
+            selectedColour = WidgetGrid._defaultSelectedColour
+        if oddColour      is None: oddColour  = WidgetGrid._defaultOddColour
+        if evenColour     is None: evenColour = WidgetGrid._defaultEvenColour
+
+        # Colour to use for even/odd rows
+        if select: colours = (selectedColour, selectedColour)
+        else:      colours = (evenColour,     oddColour)
+
+        widgets    = self.__widgets
+        widgetRefs = self.__widgetRefs
+        setColour  = self.__setBackgroundColour
+
+        for row, col in cells:
 
-        for row, col in zip(rows, cols):
+            idx       = row * ncols + col
+            container = widgets[idx]
+            colour    = colours[row % 2]
 
-            if   select:  colour = self.__selectedColour
-            elif row % 2: colour = self.__oddColour
-            else:         colour = self.__evenColour
+            # Empty cells which have not yet been
+            # created will be coloured on refresh
+            if container is None:
+                continue
 
-            container = self.__widgets[   row][col]
-            widget    = self.__widgetRefs[row][col]
-            self.__setBackgroundColour(container, colour)
-            self.__setBackgroundColour(widget,    colour)
-            widget   .Refresh()
-            container.Refresh()
+            setColour(container,       colour, refresh=True)
+            setColour(widgetRefs[idx], colour, refresh=True)
 
 
     def ShowRowLabels(self, show=True):
         """Shows/hides the grid row labels.  The :meth:`Refresh` method must
         be called afterwards for this method to take effect.
         """
-        self.__showRowLabels = show
+        show = bool(show)
+        if show != self.__showRowLabels:
+            self.__showRowLabels = show
+            self.__labelsDirty   = True
 
 
     def ShowColLabels(self, show=True):
         """Shows/hides the grid column labels. The :meth:`Refresh` method must
         be called afterwards for this method to take effect.
         """
-        self.__showColLabels = show
+        show = bool(show)
+        if show != self.__showColLabels:
+            self.__showColLabels = show
+            self.__labelsDirty   = True
 
 
     def SetRowLabel(self, row, label):
@@ -1324,6 +1890,7 @@ class WidgetGrid(wx.ScrolledWindow):
         self.__colLabels[col][1].SetLabel(label)
 
 
+    @_frozen
     def SetRowLabels(self, labels):
         """Sets the label for every row.
         """
@@ -1331,10 +1898,11 @@ class WidgetGrid(wx.ScrolledWindow):
             raise ValueError('Wrong number of row labels '
                              f'({len(labels)} != {self.__nrows})')
 
-        for i, label in enumerate(labels):
-            self.__rowLabels[i][1].SetLabel(label)
+        for (_, lbl), label in zip(self.__rowLabels, labels):
+            lbl.SetLabel(label)
 
 
+    @_frozen
     def SetColLabels(self, labels):
         """Sets the label for every column.
         """
@@ -1342,8 +1910,8 @@ class WidgetGrid(wx.ScrolledWindow):
             raise ValueError('Wrong number of column labels '
                              f'({len(labels)} != {self.__ncols})')
 
-        for i, label in enumerate(labels):
-            self.__colLabels[i][1].SetLabel(label)
+        for (_, lbl), label in zip(self.__colLabels, labels):
+            lbl.SetLabel(label)
 
 
     def GetRowLabel(self, row):
@@ -1358,12 +1926,12 @@ class WidgetGrid(wx.ScrolledWindow):
 
     def GetRowLabels(self):
         """Return all row labels. """
-        return [self.__rowLabels[i][1].GetLabel() for i in range(self.__nrows)]
+        return [lbl.GetLabel() for _, lbl in self.__rowLabels]
 
 
     def GetColLabels(self):
         """Return all column labels. """
-        return [self.__colLabels[i][1].GetLabel() for i in range(self.__ncols)]
+        return [lbl.GetLabel() for _, lbl in self.__colLabels]
 
 
     def ReorderColumns(self, order):
@@ -1375,17 +1943,34 @@ class WidgetGrid(wx.ScrolledWindow):
         :arg order: Sequence of column indices (starting from 0) specifying
                     the new column ordering.
         """
-        if list(sorted(order)) != list(range(self.__ncols)):
+        ncols = self.__ncols
+        order = list(order)
+        seen  = bytearray(ncols)
+        valid = len(order) == ncols
+
+        # Make sure that order is a
+        # permutation of range(ncols)
+        if valid:
+            for i in order:
+                if i < 0 or i >= ncols or seen[i]:
+                    valid = False
+                    break
+                seen[i] = 1
+
+        if not valid:
             raise ValueError('Invalid column order (ncols: '
                              f'{self.__ncols}): {order}')
 
-        self.__colLabels = [self.__colLabels[i] for i in order]
+        self.__colLabels      = [self.__colLabels[i] for i in order]
+        self.__structureDirty = True
+        self.__locations      = None
 
-        for rowi in range(self.__nrows):
-            widgets    = self.__widgets[   rowi]
-            widgetRefs = self.__widgetRefs[rowi]
-            self.__widgets[   rowi] = [widgets[i]    for i in order]
-            self.__widgetRefs[rowi] = [widgetRefs[i] for i in order]
+        indices = [rowi * ncols + i
+                   for rowi in range(self.__nrows)
+                   for i    in order]
+
+        self.__widgets    = [self.__widgets[   i] for i in indices]
+        self.__widgetRefs = [self.__widgetRefs[i] for i in indices]
 
 
     def __onColumnLabelMouseDown(self, ev):
@@ -1401,6 +1986,8 @@ class WidgetGrid(wx.ScrolledWindow):
 
         self.__dragStartCol   = col
         self.__dragCurrentCol = col
+        self.__dragMarkerPos  = None
+        self.__dragLastPos    = None
 
         self.__colLabels[col][0].SetBackgroundColour(self.__dragColour)
         self.__colLabels[col][1].SetBackgroundColour(self.__dragColour)
@@ -1451,6 +2038,21 @@ class WidgetGrid(wx.ScrolledWindow):
         if self.__dragStartCol is None:
             return
 
+        # Motion events arrive for every pixel
+        # that the mouse moves, so we skip the
+        # (relatively expensive) drop position
+        # calculation until the mouse has moved
+        # by a few pixels.
+        pos  = wx.GetMouseState().GetPosition()
+        last = self.__dragLastPos
+
+        if last is not None          and \
+           abs(pos[0] - last[0]) < 3 and \
+           abs(pos[1] - last[1]) < 3:
+            return
+
+        self.__dragLastPos = (pos[0], pos[1])
+
         startcol   = self.__dragStartCol
         lastcol    = self.__dragCurrentCol
         currentcol = self.__getColumnDragPosition()
@@ -1463,6 +2065,7 @@ class WidgetGrid(wx.ScrolledWindow):
            startcol   == currentcol or \
            startcol   == currentcol - 1:
             self.__dragCurrentCol = None
+            self.__dragMarkerPos  = None
             panel.ClearBackground()
             return
 
@@ -1470,11 +2073,34 @@ class WidgetGrid(wx.ScrolledWindow):
         if lastcol == currentcol:
             return
 
+        # The marker position is calculated
+        # here, rather than in the paint
+        # handler, so it is only calculated
+        # when the drop column changes.
         self.__dragCurrentCol = currentcol
+        self.__dragMarkerPos  = self.__getDragMarkerPosition(currentcol)
 
         self.__dragPanel.Refresh()
 
 
+    def __getDragMarkerPosition(self, col):
+        """Called by :meth:`__onColumnLabelMouseDrag` and
+        :meth:`__dragPanelPaint`. Returns the horizontal position on the drag
+        panel at which the drop marker should be drawn, when a column is to be
+        dropped at index ``col``.
+        """
+
+        if col == self.__ncols:
+            szitem = self.__gridSizer.GetItem(self.__colLabels[-1][0])
+            xpos   = szitem.GetPosition()[0] + szitem.GetSize()[0]
+
+        else:
+            szitem = self.__gridSizer.GetItem(self.__colLabels[col][0])
+            xpos   = szitem.GetPosition()[0]
+
+        return int(xpos - 0.5 * self.__dragIcon.GetSize()[0])
+
+
     def __onColumnLabelMouseUp(self, ev):
         """Called on the mouse up event at the end of a column drag.
 
@@ -1491,6 +2117,7 @@ class WidgetGrid(wx.ScrolledWindow):
         endcol                = self.__getColumnDragPosition()
         self.__dragStartCol   = None
         self.__dragCurrentCol = None
+        self.__dragMarkerPos  = None
         self.__dragPanel.ClearBackground()
         self.__dragPanel.Refresh()
 
@@ -1539,19 +2166,11 @@ class WidgetGrid(wx.ScrolledWindow):
         if dwidth == 0 or dheight == 0:
             return
 
-        if currentcol == self.__ncols:
-            szitem = self.__gridSizer.GetItem(self.__colLabels[-1][0])
-            xpos   = szitem.GetPosition()[0] + szitem.GetSize()[0]
-
-        else:
-            szitem = self.__gridSizer.GetItem(self.__colLabels[currentcol][0])
-            xpos   = szitem.GetPosition()[0]
+        if self.__dragMarkerPos is None:
+            self.__dragMarkerPos = self.__getDragMarkerPosition(currentcol)
 
-        xpos -= 0.5 * self.__dragIcon.GetSize()[0]
-
-        self.__dragCurrentCol = currentcol
         dc.Clear()
-        dc.DrawBitmap(self.__dragIcon, int(xpos), 0, False)
+        dc.DrawBitmap(self.__dragIcon, self.__dragMarkerPos, 0, False)
 
 
 WG_SELECTABLE_CELLS = 1
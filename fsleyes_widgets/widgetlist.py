@@ -13,6 +13,7 @@ import wx
 import wx.lib.newevent      as wxevent
 import wx.lib.scrolledpanel as scrolledpanel
 
+import fsleyes_widgets.utils       as wutils
 import fsleyes_widgets.togglepanel as togglepanel
 
 
@@ -34,6 +35,8 @@ class WidgetList(scrolledpanel.ScrolledPanel):
 
         AddWidget
         AddGroup
+        BeginBatch
+        EndBatch
 
 
     A ``WidgetList`` looks something like this:
@@ -102,6 +105,28 @@ class WidgetList(scrolledpanel.ScrolledPanel):
 
         self.__oneExpanded = style & WL_ONE_EXPANDED
 
+        # Used by BeginBatch/EndBatch. While
+        # a batch update is in progress,
+        # __refresh does nothing, and the
+        # names of groups (None for top
+        # level widgets) which have had
+        # widgets added are stored in the
+        # dirtyGroups set.
+        self.__batchDepth  = 0
+        self.__dirtyGroups = set()
+
+        # Current label width for each group
+        # (None for top level widgets) - see
+        # __setLabelWidths. An entry is removed
+        # when a widget is removed from a group,
+        # so that the width is re-calculated
+        # the next time a widget is added.
+        self.__labelWidths = {}
+
+        # Used by __refresh to coalesce
+        # change events - see __postChangeEvent
+        self.__eventPending = False
+
         # The SP.__init__ method seemingly
         # induces a call to DoGetBestSize,
         # which assumes that all of the
@@ -140,19 +165,53 @@ class WidgetList(scrolledpanel.ScrolledPanel):
         return str(id(widget))
 
 
-    def __setLabelWidths(self, widgets):
-        """Calculates the maximum width of all widget labels, and sets all
-        labels to that width.
+    def __setLabelWidths(self, groupName, new=None):
+        """Calculates the maximum width of all widget labels in the given
+        group, and sets all labels to that width.
 
         This ensures that all labels/widgets line are horizontally aligned.
+
+        The width of each label is only measured once, and is cached on
+        the :class:`_Widget` object.
+
+        :arg groupName: Name of the group, or ``None`` for top level widgets.
+
+        :arg new:       Sequence of :class:`_Widget` objects which have just
+                        been added to the group. If provided, and none of
+                        their labels are wider than the current label width,
+                        only the new labels are re-sized.
         """
 
+        if groupName is None: widgets = self.__widgets
+        else:                 widgets = self.__groups[groupName].widgets
+
+        widgets = list(widgets.values())
+        current = self.__labelWidths.get(groupName, None)
+
         if len(widgets) == 0:
             return
 
-        dc        = wx.ClientDC(widgets[0].label)
-        lblWidths = [dc.GetTextExtent(w.displayName)[0] for w in widgets]
-        maxWidth  = max(lblWidths)
+        if current is None or new is None:
+            new = widgets
+
+        dc = None
+
+        for w in new:
+            if w.labelWidth is None:
+                if dc is None:
+                    dc = wx.ClientDC(w.label)
+                w.labelWidth = dc.GetTextExtent(w.displayName)[0]
+
+        maxWidth = max(w.labelWidth for w in new)
+
+        # The new labels fit within the
+        # current width, so only the new
+        # labels need to be re-sized
+        if current is not None and maxWidth <= current:
+            maxWidth = current
+            widgets  = new
+
+        self.__labelWidths[groupName] = maxWidth
 
         for w in widgets:
             w.label.SetMinSize((maxWidth + 10, -1))
@@ -165,12 +224,13 @@ class WidgetList(scrolledpanel.ScrolledPanel):
         Makes sure that odd/even widgets and their labels have the correct
         background colour.
         """
+
+        # Colour to use for even/odd rows
+        colours = (self.__evenColour, self.__oddColour)
+
         def setWidgetColours(widgDict):
             for i, widg in enumerate(widgDict.values()):
-
-                if i % 2: colour = self.__oddColour
-                else:     colour = self.__evenColour
-                widg.SetBackgroundColour(colour)
+                widg.SetBackgroundColour(colours[i % 2])
 
         setWidgetColours(self.__widgets)
 
@@ -186,14 +246,76 @@ class WidgetList(scrolledpanel.ScrolledPanel):
         the widget list.
 
         :arg postEvent: If ``True`` (the default), a
-                        :data:`WidgetListChangeEvent` is posted.
+                        :data:`WidgetListChangeEvent` is posted. The
+                        event is posted asynchronously, and only one event
+                        is posted for any number of refreshes in between.
+
+        If a batch update is in progress (see :meth:`BeginBatch`), this
+        method does nothing - the list is refreshed in :meth:`EndBatch`.
         """
+
+        if self.__batchDepth > 0:
+            return
+
         self.__setColours()
         self.FitInside()
         self.Layout()
 
-        if kwargs.get('postEvent', True):
-            wx.PostEvent(self, WidgetListChangeEvent())
+        if kwargs.get('postEvent', True) and not self.__eventPending:
+            self.__eventPending = True
+            wx.CallAfter(self.__postChangeEvent)
+
+
+    def __postChangeEvent(self):
+        """Called via ``wx.CallAfter`` by :meth:`__refresh`. Generates a
+        :data:`WidgetListChangeEvent`.
+        """
+
+        if not wutils.isalive(self):
+            return
+
+        self.__eventPending = False
+        self.GetEventHandler().ProcessEvent(WidgetListChangeEvent())
+
+
+    def BeginBatch(self):
+        """Begin a batch update of this ``WidgetList``. Until the matching
+        call to :meth:`EndBatch`, the list is frozen, and is not laid out or
+        re-coloured after every change. This is useful when adding or
+        removing many widgets at once.
+
+        Calls to ``BeginBatch`` may be nested - the batch update ends when
+        ``EndBatch`` has been called once for every call to ``BeginBatch``.
+        """
+        self.__batchDepth += 1
+        if self.__batchDepth == 1:
+            self.Freeze()
+
+
+    def EndBatch(self):
+        """End a batch update of this ``WidgetList`` (see
+        :meth:`BeginBatch`). When the outermost batch update ends, widget
+        labels are re-sized and the list is refreshed.
+        """
+
+        if self.__batchDepth == 0:
+            raise ValueError('EndBatch called without BeginBatch')
+
+        self.__batchDepth -= 1
+
+        if self.__batchDepth > 0:
+            return
+
+        try:
+            for groupName in self.__dirtyGroups:
+                if groupName is None or groupName in self.__groups:
+                    self.__setLabelWidths(groupName)
+
+            self.__dirtyGroups = set()
+            self.__refresh()
+
+        finally:
+            self.Thaw()
 
 
     def SetColours(self, odd=None, even=None, group=None):
@@ -206,9 +328,13 @@ class WidgetList(scrolledpanel.ScrolledPanel):
         :arg even:  Background colour for widgets on even rows.
         :arg group: Border/title colour for widget groups.
         """
-        if odd   is not None: self.__oddColour   = odd
-        if even  is not None: self.__evenColour  = even
-        if group is not None: self.__groupColour = group
+
+        # Colours are converted to wx.Colour
+        # objects here, so wx does not need to
+        # convert them on every refresh
+        if odd   is not None: self.__oddColour   = wx.Colour(odd)
+        if even  is not None: self.__evenColour  = wx.Colour(even)
+        if group is not None: self.__groupColour = wx.Colour(group)
         self.__setColours()
 
 
@@ -367,24 +493,33 @@ class WidgetList(scrolledpanel.ScrolledPanel):
         widgSizer = wx.BoxSizer(wx.HORIZONTAL)
         widgPanel.SetSizer(widgSizer)
 
-        if isinstance(widget, wx.Sizer):
-            for child in widget.GetChildren():
-                window = child.GetWindow()
-                if window is not None:
-                    window.Reparent(widgPanel)
-        else:
-            w, h = widget.GetBestSize().Get()
-            if self.__minHeight > h:
-                h = self.__minHeight
-            widget.SetMinSize( (w, h))
-            widget.Reparent(widgPanel)
-
-        label = wx.StaticText(widgPanel,
-                              label=displayName,
-                              style=wx.ALIGN_RIGHT)
-
-        widgSizer.Add(label,  flag=wx.EXPAND)
-        widgSizer.Add(widget, flag=wx.EXPAND, proportion=1)
+        # Freeze the new panel while the widget
+        # (or sizer children) are moved into it,
+        # so it is only redrawn once
+        widgPanel.Freeze()
+
+        try:
+            if isinstance(widget, wx.Sizer):
+                for child in widget.GetChildren():
+                    window = child.GetWindow()
+                    if window is not None:
+                        window.Reparent(widgPanel)
+            else:
+                w, h = widget.GetBestSize().Get()
+                if self.__minHeight > h:
+                    h = self.__minHeight
+                widget.SetMinSize( (w, h))
+                widget.Reparent(widgPanel)
+
+            label = wx.StaticText(widgPanel,
+                                  label=displayName,
+                                  style=wx.ALIGN_RIGHT)
+
+            widgSizer.Add(label,  flag=wx.EXPAND)
+            widgSizer.Add(widget, flag=wx.EXPAND, proportion=1)
+
+        finally:
+            widgPanel.Thaw()
 
         parentSizer.Add(widgPanel,
                         flag=wx.EXPAND | wx.LEFT | wx.RIGHT,
@@ -411,8 +546,13 @@ class WidgetList(scrolledpanel.ScrolledPanel):
 
         widgDict[key] = widg
 
-        self.__setLabelWidths(list(widgDict.values()))
-        self.__refresh()
+        # Label widths are updated at
+        # the end of a batch update
+        if self.__batchDepth > 0:
+            self.__dirtyGroups.add(groupName)
+        else:
+            self.__setLabelWidths(groupName, [widg])
+            self.__refresh()
 
 
     def __onMouseWheel(self, ev):
@@ -483,6 +623,7 @@ class WidgetList(scrolledpanel.ScrolledPanel):
 
         widg = widgDict.pop(key)
         parentSizer.Detach(widg.panel)
+        self.__labelWidths.pop(groupName, None)
 
         widg.Destroy()
         self.__refresh()
@@ -494,6 +635,7 @@ class WidgetList(scrolledpanel.ScrolledPanel):
         """
         group = self.__groups.pop(groupName)
 
+        self.__labelWidths.pop(groupName, None)
         self.__groupSizer.Detach(group.gapSizer)
         group.parentPanel.Destroy()
         self.__refresh()
@@ -501,14 +643,24 @@ class WidgetList(scrolledpanel.ScrolledPanel):
 
     def Clear(self):
         """Removes and destroys all widgets and groups. """
-        for key in list(self.__widgets.keys()):
-            widg = self.__widgets.pop(key)
-            self.__widgSizer.Detach(widg.sizer)
-            widg.Destroy()
 
-        for group in self.GetGroups():
-            self.RemoveGroup(group)
-        self.__refresh()
+        # The list is only refreshed
+        # once, at the end of the batch
+        self.BeginBatch()
+
+        try:
+            # Destroys the panels for all
+            # top level widgets (and their
+            # contents), and any spaces
+            self.__widgSizer.Clear(True)
+            self.__widgets.clear()
+            self.__labelWidths.pop(None, None)
+
+            for group in self.GetGroups():
+                self.RemoveGroup(group)
+
+        finally:
+            self.EndBatch()
 
 
     def ClearGroup(self, groupName):
@@ -518,6 +670,7 @@ class WidgetList(scrolledpanel.ScrolledPanel):
         group = self.__groups[groupName]
         group.sizer.Clear(True)
         group.widgets.clear()
+        self.__labelWidths.pop(groupName, None)
         self.__refresh()
 
 
@@ -561,6 +714,10 @@ class _Widget:
         self.panel       = panel
         self.sizer       = sizer
 
+        # Width of the label text, in pixels -
+        # set by WidgetList.__setLabelWidths
+        self.labelWidth  = None
+
 
     def SetBackgroundColour(self, colour):
         self.panel.SetBackgroundColour(colour)